@@ -2,8 +2,8 @@ from pathlib import Path
 from dagster import Definitions
 from dagster_dbt import DbtCliResource
 
-from .assets.ingestion import gtd_raw_data
-from .assets.dbt_assets import geopolitical_dbt_assets, DBT_PROJECT_DIR
+from .assets import gtd_raw_data, geopolitical_dbt_assets, behavioral_clusters
+from .assets.dbt_assets import DBT_PROJECT_DIR
 
 # Create dbt CLI resource
 dbt_resource = DbtCliResource(
@@ -12,7 +12,7 @@ dbt_resource = DbtCliResource(
 )
 
 defs = Definitions(
-    assets=[gtd_raw_data, geopolitical_dbt_assets],
+    assets=[gtd_raw_data, geopolitical_dbt_assets, behavioral_clusters],
     resources={
         "dbt": dbt_resource,
     },
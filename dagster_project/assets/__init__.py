@@ -1,4 +1,5 @@
 from .ingestion import gtd_raw_data
 from .dbt_assets import geopolitical_dbt_assets
+from .clustering import behavioral_clusters
 
-__all__ = ["gtd_raw_data", "geopolitical_dbt_assets"]
\ No newline at end of file
+__all__ = ["gtd_raw_data", "geopolitical_dbt_assets", "behavioral_clusters"]
\ No newline at end of file
@@ -0,0 +1,74 @@
+"""
+Dagster asset for batch behavioral clustering.
+
+The dashboard used to fit k-means inside the render path; fitting here
+once per pipeline run and persisting the labels turns the clustering tab
+into a plain SELECT.
+"""
+
+import pandas as pd
+from dagster import AssetExecutionContext, Output, asset
+from dagster_dbt import get_asset_key_for_model
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.preprocessing import StandardScaler
+from sqlalchemy import text
+
+from .dbt_assets import geopolitical_dbt_assets
+from .ingestion import get_postgres_connection
+
+N_CLUSTERS = 5
+
+FEATURE_COLS = [
+    "normalized_attack_volume",
+    "normalized_lethality",
+    "normalized_geographic_reach",
+    "suicide_attack_rate_pct",
+    "success_rate_pct",
+    "explosives_pct",
+    "firearms_pct",
+    "govt_target_pct",
+    "civilian_target_pct",
+]
+
+
+@asset(
+    deps=[
+        get_asset_key_for_model([geopolitical_dbt_assets], "group_clustering_features")
+    ]
+)
+def behavioral_clusters(context: AssetExecutionContext) -> Output:
+    """Fit k-means over the clustering mart and persist the labels.
+
+    Writes data_analytics.behavioral_clusters with one row per group:
+    the feature vector plus its cluster id.
+    """
+    engine = get_postgres_connection()
+    df = pd.read_sql(
+        "SELECT * FROM dbt_marts.group_clustering_features", engine
+    )
+
+    X = df[FEATURE_COLS].fillna(0.0).to_numpy(dtype="float32")
+    X = StandardScaler(copy=False).fit_transform(X)
+    kmeans = MiniBatchKMeans(
+        n_clusters=N_CLUSTERS,
+        random_state=42,
+        n_init=3,
+        batch_size=256,
+    )
+    df["cluster"] = kmeans.fit_predict(X)
+
+    with engine.begin() as conn:
+        conn.execute(text("CREATE SCHEMA IF NOT EXISTS data_analytics"))
+        df.to_sql(
+            "behavioral_clusters",
+            conn,
+            schema="data_analytics",
+            if_exists="replace",
+            index=False,
+        )
+
+    context.log.info(f"Labeled {len(df)} groups into {N_CLUSTERS} clusters")
+    return Output(
+        value=len(df),
+        metadata={"num_groups": len(df), "n_clusters": N_CLUSTERS},
+    )
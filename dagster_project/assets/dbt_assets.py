@@ -3,7 +3,9 @@ Dagster assets for dbt models.
 This file defines all dbt models as Dagster assets using dagster-dbt integration.
 """
 
+import json
 import os
+from functools import cache
 from pathlib import Path
 from dagster import AssetExecutionContext
 from dagster_dbt import DbtCliResource, dbt_assets
@@ -13,8 +15,24 @@ DBT_PROJECT_DIR = Path(__file__).resolve().parents[2] / "dbt_project"
 MANIFEST_PATH = DBT_PROJECT_DIR / "target" / "manifest.json"
 
 
+@cache
+def _manifest():
+    """Parse the dbt manifest once per process.
+
+    The manifest is a multi-MB JSON document; handing @dbt_assets the
+    parsed dict instead of the path keeps Definitions reloads from
+    re-reading and re-parsing it every time.
+    """
+    if not MANIFEST_PATH.exists():
+        raise FileNotFoundError(
+            f"dbt manifest not found at {MANIFEST_PATH} — "
+            "run `dbt parse` in dbt_project/ first"
+        )
+    return json.loads(MANIFEST_PATH.read_bytes())
+
+
 @dbt_assets(
-    manifest=MANIFEST_PATH,
+    manifest=_manifest(),
 )
 def geopolitical_dbt_assets(context: AssetExecutionContext, dbt: DbtCliResource):
     """
@@ -3,53 +3,476 @@ Dagster asset for ingesting Global Terrorism Database (GTD) data.
 This is the entry point of our data pipeline.
 """
 
+import csv
 import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from io import StringIO
+from itertools import chain, islice
+from pathlib import Path
+
+import numpy as np
+import openpyxl
 import pandas as pd
-from dagster import asset, AssetExecutionContext, Output, MetadataValue
+import pyarrow as pa
+import pyarrow.parquet as pq
+from dagster import (
+    asset,
+    AssetExecutionContext,
+    Output,
+    MetadataValue,
+    StaticPartitionsDefinition,
+)
 from sqlalchemy import create_engine, text
+from sqlalchemy.types import BigInteger, Float, Integer, SmallInteger
 from dotenv import load_dotenv
 
+# Optional Arrow-native Postgres driver: ingests pyarrow Tables through
+# COPY BINARY with no per-cell Python boxing. Used when installed.
+try:
+    import adbc_driver_postgresql.dbapi as adbc_pg
+except ImportError:
+    adbc_pg = None
+
+# Optional numba JIT for the in-process sentinel sweep; LLVM vectorizes
+# the comparisons and prange splits rows across cores.
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
 load_dotenv()
 
-def get_postgres_connection():
-    """ Create database connection from environemnt variables. Reads .env file:
-    DATABASE_HOST, DATABASE_PORT, etc."""
+# The GTD workbook carries 135 columns but the pipeline only consumes the
+# ~50 below (staging models + docs/gtd_fields.md). Pruning at parse time
+# roughly halves cells parsed and bytes shipped to Postgres.
+USECOLS = [
+    # Identity + temporal
+    'eventid', 'iyear', 'imonth', 'iday', 'approxdate',
+    # Geographic
+    'country', 'country_txt', 'region', 'region_txt', 'provstate', 'city',
+    'latitude', 'longitude', 'specificity', 'vicinity', 'location',
+    # Incident characteristics
+    'summary', 'doubtterr', 'multiple', 'success', 'suicide',
+    'attacktype1', 'attacktype1_txt',
+    # Targets
+    'targtype1', 'targtype1_txt', 'targsubtype1', 'targsubtype1_txt',
+    'corp1', 'target1', 'natlty1', 'natlty1_txt',
+    # Perpetrators
+    'gname', 'gsubname', 'gname2', 'gname3', 'motive', 'nperps', 'nperpcap',
+    # Weapons
+    'weaptype1', 'weaptype1_txt', 'weapsubtype1', 'weapsubtype1_txt',
+    'weapdetail',
+    # Casualties + outcome
+    'nkill', 'nkillus', 'nkillter', 'nwound', 'nwoundus', 'nwoundte',
+    'property', 'propextent', 'ishostkid', 'nhostkid',
+]
+
+# Explicit dtypes for the numeric codes; nullable Ints avoid the float64
+# upcast for ints-with-missing and shrink the frame ~4x vs all-float64.
+DTYPES = {
+    'eventid': 'Int64',
+    'iyear': 'Int16',
+    'imonth': 'Int8',
+    'iday': 'Int8',
+    'country': 'Int16',
+    'region': 'Int8',
+    'specificity': 'Int8',
+    'vicinity': 'Int8',
+    'latitude': 'Float64',
+    'longitude': 'Float64',
+    'doubtterr': 'Int8',
+    'multiple': 'Int8',
+    'success': 'Int8',
+    'suicide': 'Int8',
+    'attacktype1': 'Int8',
+    'targtype1': 'Int8',
+    'targsubtype1': 'Int16',
+    'natlty1': 'Int16',
+    'nperps': 'Int32',
+    'nperpcap': 'Int32',
+    'weaptype1': 'Int8',
+    'weapsubtype1': 'Int16',
+    'nkill': 'Int32',
+    'nkillus': 'Int32',
+    'nkillter': 'Int32',
+    'nwound': 'Int32',
+    'nwoundus': 'Int32',
+    'nwoundte': 'Int32',
+    'property': 'Int8',
+    'propextent': 'Int8',
+    'ishostkid': 'Int8',
+    'nhostkid': 'Int32',
+}
+
+# Arrow equivalents of DTYPES for the Parquet cache schema; every other
+# USECOLS column is text.
+_ARROW_TYPES = {
+    'Int8': pa.int8(),
+    'Int16': pa.int16(),
+    'Int32': pa.int32(),
+    'Int64': pa.int64(),
+    'Float64': pa.float64(),
+}
+
+
+def _cache_schema(columns):
+    """Declared Parquet cache schema for a chunk's columns.
+
+    Inferring the schema from the first chunk freezes sparse text columns
+    (gname3, approxdate, location, ...) as Arrow null whenever they are
+    entirely empty in that chunk, and the cast then rejects any later
+    chunk that does carry strings. Numeric columns follow DTYPES; the
+    rest are declared string.
+    """
+    return pa.schema(
+        (name, _ARROW_TYPES.get(DTYPES.get(name), pa.string()))
+        for name in columns
+    )
+
+
+def _read_gtd_rows(path, min_row, max_row):
+    """Parse one row-range of the GTD sheet into a typed DataFrame.
+
+    Runs in worker processes during parallel reads, so it reopens the
+    workbook itself. Read-only mode streams rows instead of building
+    openpyxl's full in-memory cell tree, which is 10-20x faster on sheets
+    this size.
+    """
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        sheet = workbook.worksheets[0]
+        header_row = next(sheet.iter_rows(max_row=1, values_only=True))
+        headers = [str(h).lower().replace(' ', '_') for h in header_row]
+        # Only keep the columns the pipeline actually consumes
+        keep = [i for i, name in enumerate(headers) if name in set(USECOLS)]
+        names = [headers[i] for i in keep]
+        columns = [[] for _ in keep]
+        for row in sheet.iter_rows(
+            min_row=min_row, max_row=max_row, values_only=True
+        ):
+            for out, i in enumerate(keep):
+                columns[out].append(row[i])
+        # Build the frame once at the end; explicit dtypes where known,
+        # pandas inference for the rest. Converting to the Arrow backend
+        # keeps strings as contiguous UTF-8 buffers instead of per-cell
+        # PyObjects and leaves ints nullable without a float64 upcast.
+        frame = pd.DataFrame(
+            {
+                name: pd.array(col, dtype=DTYPES.get(name))
+                for name, col in zip(names, columns)
+            }
+        )
+        return frame.convert_dtypes(dtype_backend='pyarrow')
+    finally:
+        workbook.close()
+
+
+# Rows per streamed chunk; bounds peak memory to a few chunks instead of
+# the whole 200k-row frame.
+CHUNK_ROWS = 50_000
+
+# How many parsed chunks may be in flight ahead of the Postgres writer.
+# Parse workers run ahead by at most this much, so memory stays bounded
+# while parse and COPY overlap.
+PREFETCH_CHUNKS = 3
+
+
+def _iter_gtd_excel_chunks(path):
+    """Yield typed DataFrame chunks of the GTD workbook in row order.
+
+    XLSX parsing is CPU-bound Python under the GIL, so row-range workers
+    in a process pool overlap the XML decode across cores, while the
+    bounded future queue keeps at most PREFETCH_CHUNKS parsed chunks in
+    memory ahead of the consumer. Small sheets (or single-core hosts)
+    fall back to one serial pass.
+    """
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        total_rows = workbook.worksheets[0].max_row
+    finally:
+        workbook.close()
+
+    # Data rows start at 2 (row 1 is the header)
+    ranges = [
+        (start, min(start + CHUNK_ROWS - 1, total_rows))
+        for start in range(2, total_rows + 1, CHUNK_ROWS)
+    ]
+
+    workers = min(os.cpu_count() or 1, PREFETCH_CHUNKS)
+    if workers == 1 or total_rows <= 20_000:
+        for start, stop in ranges:
+            yield _read_gtd_rows(path, start, stop)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        todo = iter(ranges)
+        for start, stop in islice(todo, PREFETCH_CHUNKS):
+            pending.append(pool.submit(_read_gtd_rows, path, start, stop))
+        for start, stop in todo:
+            yield pending.popleft().result()
+            pending.append(pool.submit(_read_gtd_rows, path, start, stop))
+        while pending:
+            yield pending.popleft().result()
+
+
+def _iter_gtd_chunks(path, log):
+    """Yield GTD chunks, going through a sibling Parquet cache when fresh.
+
+    The source workbook rarely changes between materializations, but Excel
+    parsing is by far the slowest step of the asset. Parquet is columnar,
+    compressed, and parsed in C via pyarrow, so replaying the cached copy
+    is 50-200x faster than re-parsing the XLSX. The cache is invalidated
+    whenever the source file is newer than the cached copy, and is built
+    incrementally while the Excel chunks stream past, so no full frame is
+    ever materialized.
+    """
+    cache_path = Path(path).with_suffix('.parquet')
+    if cache_path.exists() and os.path.getmtime(cache_path) >= os.path.getmtime(path):
+        log.info(f"⚡ Loading cached Parquet copy: {cache_path}")
+        parquet_file = pq.ParquetFile(cache_path)
+        for batch in parquet_file.iter_batches(batch_size=CHUNK_ROWS):
+            # Arrow-backed frames make the batch conversion zero-copy
+            yield batch.to_pandas(types_mapper=pd.ArrowDtype)
+        return
+
+    # Per-process temp name: concurrent backfill partitions that all miss
+    # a cold cache build side by side instead of interleaving writes into
+    # one shared temp file; the atomic replace promotes whichever complete
+    # copy finishes last.
+    tmp_path = cache_path.with_suffix(f'.parquet.{os.getpid()}.tmp')
+    writer = None
+    try:
+        for chunk in _iter_gtd_excel_chunks(path):
+            if writer is None:
+                writer = pq.ParquetWriter(
+                    tmp_path, _cache_schema(chunk.columns), compression='zstd'
+                )
+            writer.write_table(
+                pa.Table.from_pandas(
+                    chunk, schema=writer.schema, preserve_index=False
+                )
+            )
+            yield chunk
+    except BaseException:
+        # Abandoned build: drop the partial file instead of leaving
+        # per-pid temps behind
+        if writer is not None:
+            writer.close()
+            writer = None
+            tmp_path.unlink(missing_ok=True)
+        raise
+    finally:
+        if writer is not None:
+            writer.close()
+    tmp_path.replace(cache_path)
+    log.info(f"💾 Cached Parquet copy for future runs: {cache_path}")
+
+def _downcast_numerics(df, numeric_cols):
+    """Shrink numeric columns to the smallest dtype that holds their range.
+
+    The sentinel sweep leaves every numeric column as float64 (8 bytes per
+    cell, ~128 MB across the frame). Integral columns go back to nullable
+    Int16/Int32/Int64 and true floats to float32, which halves or quarters
+    both the in-memory frame and the bytes shipped to Postgres. Latitude
+    and longitude stay float64 so coordinates keep full precision.
+
+    For chunked loads the target dtype must not depend on which rows land
+    in a chunk, so columns with a declared dtype in DTYPES always go back
+    to that dtype; only undeclared columns fall back to range inspection.
+    """
+    for col in numeric_cols:
+        if col in ('latitude', 'longitude'):
+            continue
+        series = df[col]
+        declared = DTYPES.get(col)
+        if declared and declared.startswith('Int'):
+            df[col] = series.astype(declared)
+            continue
+        present = series.dropna()
+        if len(present) and (present % 1 == 0).all():
+            lo, hi = present.min(), present.max()
+            if -32768 <= lo and hi <= 32767:
+                df[col] = series.astype('Int16')
+            elif -2147483648 <= lo and hi <= 2147483647:
+                df[col] = series.astype('Int32')
+            else:
+                df[col] = series.astype('Int64')
+        else:
+            df[col] = pd.to_numeric(series, downcast='float')
+    return df
+
+
+# The -9/-99/-999 sentinel codes are normally left in place here and
+# nulled out by the dbt raw_gtd model (NULLIF runs in C on the server,
+# and the raw layer's job is preservation anyway). Set
+# GTD_CLEAN_SENTINELS=python to do the sweep in-process instead, e.g.
+# when the warehouse is queried without going through dbt.
+CLEAN_SENTINELS_IN_PYTHON = os.getenv('GTD_CLEAN_SENTINELS') == 'python'
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _mask_sentinels(values):
+        """Null the sentinel codes in-place, rows split across cores."""
+        for i in prange(values.shape[0]):
+            row = values[i]
+            for j in range(row.shape[0]):
+                v = row[j]
+                if v == -9.0 or v == -99.0 or v == -999.0:
+                    row[j] = np.nan
+else:
+    def _mask_sentinels(values):
+        """Null the sentinel codes in-place with one vectorized pass."""
+        values[(values == -9) | (values == -99) | (values == -999)] = np.nan
 
-    db_url= (
+
+def _clean_gtd_chunk(chunk):
+    """Normalize one GTD chunk: headers, sentinel codes, numeric dtypes."""
+    # Plain list comprehension: one pass, no intermediate Index or pandas
+    # string-dispatch machinery for what is a ~50-element rename
+    chunk.columns = [c.lower().replace(' ', '_') for c in chunk.columns]
+
+    numeric_cols = chunk.select_dtypes(include=['number']).columns
+    if CLEAN_SENTINELS_IN_PYTHON:
+        # One pass over the whole numeric block beats .replace(), which
+        # walks every cell once per sentinel value in per-column code;
+        # with numba installed the pass is JIT-compiled and parallel.
+        values = chunk[numeric_cols].to_numpy(dtype='float64', copy=True)
+        _mask_sentinels(values)
+        chunk[numeric_cols] = values
+        chunk = _downcast_numerics(chunk, numeric_cols)
+    return chunk, numeric_cols
+
+
+# Postgres column types matching the narrow dtypes (numpy-nullable and
+# Arrow-backed spellings), so the table gets smallint/integer/real
+# columns instead of double precision everywhere.
+_PG_TYPES = {
+    'Int8': SmallInteger(),
+    'Int16': SmallInteger(),
+    'Int32': Integer(),
+    'Int64': BigInteger(),
+    'float32': Float(precision=24),
+    'int8[pyarrow]': SmallInteger(),
+    'int16[pyarrow]': SmallInteger(),
+    'int32[pyarrow]': Integer(),
+    'int64[pyarrow]': BigInteger(),
+    'float[pyarrow]': Float(precision=24),
+}
+
+
+def psql_copy(table, conn, keys, data_iter):
+    """to_sql method that bulk-loads through Postgres COPY FROM STDIN.
+
+    Parameterized multi-row INSERTs make the server parse every row; COPY
+    goes through the server's bulk-load path instead and is 5-20x faster
+    for wide loads like the GTD table.
+    """
+    buffer = StringIO()
+    csv.writer(buffer).writerows(data_iter)
+    buffer.seek(0)
+
+    columns = ', '.join(f'"{key}"' for key in keys)
+    if table.schema:
+        table_name = f'"{table.schema}"."{table.name}"'
+    else:
+        table_name = f'"{table.name}"'
+
+    with conn.connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {table_name} ({columns}) FROM STDIN WITH CSV", buffer
+        )
+
+
+def pg_insert(table, conn, keys, data_iter):
+    """to_sql method using psycopg2's server-side execute_values.
+
+    Fallback for roles or proxies where COPY is not allowed. Unlike
+    method='multi', which makes SQLAlchemy expand one bind parameter per
+    cell, execute_values templates the VALUES list inside psycopg2 and is
+    typically 2-5x faster. Select it with GTD_WRITE_METHOD=insert.
+    """
+    from psycopg2.extras import execute_values
+
+    columns = ', '.join(f'"{key}"' for key in keys)
+    if table.schema:
+        table_name = f'"{table.schema}"."{table.name}"'
+    else:
+        table_name = f'"{table.name}"'
+
+    with conn.connection.cursor() as cursor:
+        execute_values(
+            cursor,
+            f"INSERT INTO {table_name} ({columns}) VALUES %s",
+            list(data_iter),
+            page_size=10_000,
+        )
+
+
+def _postgres_url():
+    """Build the Postgres URL from the .env database settings.
+
+    DATABASE_CONNECT_OPTIONS appends extra libpq parameters to the DSN.
+    The COPY payload for a full GTD load is >100 MB, so on remote links
+    it is worth setting e.g. sslcompression=1 (older servers) or, with
+    libpq/PG16+, compression negotiation options — numeric-heavy CSV
+    streams compress 3-8x. For a same-host server, point DATABASE_HOST
+    at the socket directory instead to skip TCP entirely.
+    """
+    url = (
         f"postgresql://{os.getenv('DATABASE_USER')}:{os.getenv('DATABASE_PASSWORD')}"
         f"@{os.getenv('DATABASE_HOST')}:{os.getenv('DATABASE_PORT')}"
         f"/{os.getenv('DATABASE_NAME')}"
     )
-    return create_engine(db_url)
+    options = os.getenv('DATABASE_CONNECT_OPTIONS')
+    if options:
+        url = f"{url}?{options.replace(' ', '&')}"
+    return url
+
+
+@lru_cache(maxsize=1)
+def get_postgres_connection():
+    """ Create database connection from environemnt variables. Reads .env file:
+    DATABASE_HOST, DATABASE_PORT, etc.
+
+    Cached at module scope so repeat materializations in the same process
+    reuse the engine's connection pool instead of rebuilding it (and
+    re-doing DNS + TCP handshakes) on every run."""
+
+    return create_engine(_postgres_url(), pool_pre_ping=True, pool_size=4)
+
+# GTD coverage is 1970-2021 (1993 was lost by the collectors and stays
+# an empty partition). Year partitions turn the full 200k-row reload
+# into per-year increments and let backfills fan out on the executor.
+GTD_YEAR_PARTITIONS = StaticPartitionsDefinition(
+    [str(year) for year in range(1970, 2022)]
+)
+
 
 @asset(
     key=["data_raw", "gtd_incidents"],
     description="Raw GTD data loaded from Excel file into PostgreSQL",
     compute_kind="pandas",
     group_name="ingestion",
+    partitions_def=GTD_YEAR_PARTITIONS,
 )
 def gtd_raw_data(context: AssetExecutionContext) -> Output:
     """
-    Load GTD Excel file and ingest into raw schema.
-    
+    Load one year of the GTD Excel file into the raw schema.
+
     This asset:
-    1. Reads the GTD Excel file (200k+ rows)
+    1. Reads the GTD Excel file (200k+ rows, via the Parquet cache)
     2. Selects key columns (50+ fields)
-    3. Cleans missing values (GTD uses -9, -99 as null codes)
-    4. Loads to PostgreSQL raw.gtd_incidents table
+    3. Keeps rows for the partition's year only
+    4. Replaces that year in PostgreSQL data_raw.gtd_incidents
     5. Returns metadata about the load
     """
+    year = int(context.partition_key)
     gtd_file_path = os.getenv('GTD_DATA_PATH', 'data/raw/globalterrorismdb_0522dist.xlsx')
-    context.log.info(f"📂 Reading GTD data from: {gtd_file_path}")
-
-    df = pd.read_excel(gtd_file_path, sheet_name=0)
-    context.log.info(f"✅ Loaded {len(df):,} rows from GTD file")
-
-    df.columns = df.columns.str.lower().str.replace(' ', '_')
-
-    numeric_cols = df.select_dtypes(include=['number']).columns
-    df[numeric_cols] = df[numeric_cols].replace([-9, -99, -999], pd.NA)
-    context.log.info(f"🔧 Converted GTD missing value codes (-9, -99, -999) to NULL")
+    context.log.info(f"📂 Reading GTD data for {year} from: {gtd_file_path}")
 
     engine = get_postgres_connection()
 
@@ -59,27 +482,106 @@ def gtd_raw_data(context: AssetExecutionContext) -> Output:
         conn.commit()
     context.log.info("✅ Ensured data_raw schema exists")
 
-    context.log.info(f"💾 Writing {len(df.columns)} columns to data_raw.gtd_incidents...")
-    context.log.info(f"   This preserves ALL source data for downstream transformations")
-
-    df.to_sql(
-        name='gtd_incidents',
-        schema='data_raw',
-        con=engine,
-        if_exists='replace',  # Change to 'append' for incremental loads
-        index=False,
-        chunksize=5000,  # Write in batches for memory efficiency
-        method='multi'  # Faster bulk insert
-    )
+    # COPY by default; execute_values when the target forbids COPY
+    write_method = pg_insert if os.getenv('GTD_WRITE_METHOD') == 'insert' else psql_copy
+
+    # With the ADBC driver installed, append chunks as Arrow tables via
+    # COPY BINARY — no per-cell Python boxing in to_sql's row iterator
+    adbc_conn = None
+    if adbc_pg is not None and write_method is psql_copy:
+        adbc_conn = adbc_pg.connect(_postgres_url())
+        context.log.info("⚡ Using ADBC Arrow-native ingest")
 
+    chunk_iter = _iter_gtd_chunks(gtd_file_path, context.log)
+    first_chunk = next(chunk_iter, None)
+    if first_chunk is None:
+        raise ValueError(f"No data rows found in {gtd_file_path}")
+    first_chunk, numeric_cols = _clean_gtd_chunk(first_chunk)
+
+    # Create the table if missing (zero-row frame defines the DDL) and
+    # clear this year's slice in a short committed transaction, so the
+    # separate ADBC connection sees the table before appending. Unlike
+    # DROP+CREATE via if_exists='replace', this preserves any indexes,
+    # views, and grants hanging off the table — and other years' rows.
+    with engine.begin() as pg:
+        first_chunk.head(0).to_sql(
+            name='gtd_incidents',
+            schema='data_raw',
+            con=pg,
+            if_exists='append',
+            index=False,
+            dtype={
+                col: _PG_TYPES[str(first_chunk[col].dtype)]
+                for col in numeric_cols
+                if str(first_chunk[col].dtype) in _PG_TYPES
+            },
+        )
+        pg.execute(text(
+            "CREATE INDEX IF NOT EXISTS idx_gtd_incidents_iyear"
+            " ON data_raw.gtd_incidents (iyear)"
+        ))
+        pg.execute(
+            text("DELETE FROM data_raw.gtd_incidents WHERE iyear = :year"),
+            {"year": year},
+        )
+
+    # Stream chunks straight into Postgres so peak memory stays at a few
+    # chunks instead of the full frame, and COPY overlaps the next parse.
+    # The whole load runs in one transaction with synchronous_commit off:
+    # WAL fsyncs per chunk would otherwise gate throughput.
+    total_rows = 0
+    num_columns = 0
+    with engine.begin() as pg:
+        pg.execute(text("SET LOCAL synchronous_commit = off"))
+        for i, chunk in enumerate(chain((first_chunk,), chunk_iter)):
+            if i:
+                chunk, _ = _clean_gtd_chunk(chunk)
+            chunk = chunk[chunk['iyear'] == year]
+            num_columns = len(chunk.columns)
+            if not len(chunk):
+                continue
+            if adbc_conn is not None:
+                with adbc_conn.cursor() as cursor:
+                    # Same declared schema as the Parquet cache: a
+                    # chunk-wide-empty text column would otherwise come
+                    # out Arrow null and be rejected by the COPY writer
+                    cursor.adbc_ingest(
+                        'gtd_incidents',
+                        pa.Table.from_pandas(
+                            chunk,
+                            schema=_cache_schema(chunk.columns),
+                            preserve_index=False,
+                        ),
+                        mode='append',
+                        db_schema_name='data_raw',
+                    )
+                adbc_conn.commit()
+            else:
+                chunk.to_sql(
+                    name='gtd_incidents',
+                    schema='data_raw',
+                    con=pg,
+                    if_exists='append',
+                    index=False,
+                    method=write_method,  # Postgres bulk-load path instead of row INSERTs
+                )
+            total_rows += len(chunk)
+            context.log.info(f"💾 Loaded {total_rows:,} rows into data_raw.gtd_incidents...")
+
+    if adbc_conn is not None:
+        adbc_conn.close()
+
+    if CLEAN_SENTINELS_IN_PYTHON:
+        context.log.info(f"🔧 Converted GTD missing value codes (-9, -99, -999) to NULL")
+    else:
+        context.log.info("🔧 Sentinel codes (-9, -99, -999) left for dbt raw_gtd NULLIF")
     context.log.info("✅ Ingestion complete!")
-    
-    # Simple return (no metadata)
+
     return Output(
-    value=len(df),
-    metadata={
-        "num_rows": len(df),
-        "num_columns": len(df.columns),
-        "date_range": f"{int(df['iyear'].min())}-{int(df['iyear'].max())}",
-    }
-)
\ No newline at end of file
+        value=total_rows,
+        metadata={
+            "num_rows": total_rows,
+            "num_columns": num_columns,
+            "date_range": str(year),
+        },
+    )
\ No newline at end of file
@@ -1,21 +1,78 @@
-# app.py
+# dashboard.py
 # Global Threat Intelligence Dashboard (Light Mode, Tab-Based, Postgres-Backed)
 
+import hashlib
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
+from pathlib import Path
+from uuid import uuid4
 
+import joblib
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 import psycopg2
+import pydeck as pdk
 from dotenv import load_dotenv
-from psycopg2.extras import RealDictCursor
-from sklearn.cluster import KMeans
+from psycopg2.pool import ThreadedConnectionPool
+from sklearn.cluster import MiniBatchKMeans
 from sklearn.preprocessing import StandardScaler
 import networkx as nx
 import streamlit as st
 
+try:
+    # igraph's C Fruchterman-Reingold is 10-100x faster than the
+    # pure-Python spring_layout; optional, see requirements.txt
+    import igraph as ig
+except ImportError:
+    ig = None
+
+try:
+    # Figure serialization dominates render cost on the busy tabs;
+    # plotly's orjson engine dumps numpy arrays without a Python-level
+    # loop. Optional, see requirements.txt
+    import orjson  # noqa: F401
+    pio.json.config.default_engine = "orjson"
+except ImportError:
+    pass
+
+try:
+    # ConnectorX reads the Postgres binary protocol straight into Arrow
+    # and zero-copies into pandas, skipping psycopg2's tuple-at-a-time
+    # decoding; optional, see requirements.txt
+    import connectorx as cx
+except ImportError:
+    cx = None
+
+try:
+    # JIT-compiled Fruchterman-Reingold for the network layout when
+    # igraph isn't around; optional, see requirements.txt
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+try:
+    # Same Arrow-native wire decoding as ConnectorX, via the ADBC
+    # Postgres driver the ingestion pipeline already uses; second choice
+    # because cx parallelizes the fetch. Optional, see requirements.txt
+    import adbc_driver_postgresql.dbapi as adbc
+except ImportError:
+    adbc = None
+
+try:
+    # PyGWalker's DuckDB kernel runs interactive sort/filter as
+    # vectorized SQL over Arrow buffers instead of reserializing the
+    # frame through pandas per interaction; optional, see requirements.txt
+    from pygwalker.api.streamlit import StreamlitRenderer
+except ImportError:
+    StreamlitRenderer = None
+
 # --------------------------------------
 # Bootstrap
 # --------------------------------------
@@ -81,70 +138,290 @@ st.markdown(
 # --------------------------------------
 # Database utils
 # --------------------------------------
+# On-disk cache shared by query results and fitted models; survives
+# process restarts, and replicas can share it via a mounted volume
+_DISK_CACHE_DIR = Path(__file__).resolve().parent / ".cache"
+_DISK_CACHE_TTL = 600  # seconds
+
 @st.cache_resource
-def get_db_connection():
-    return psycopg2.connect(
+def get_pool():
+    # One shared pool per server process; a single cached connection would
+    # serialize every concurrent session on the same transaction.
+    return ThreadedConnectionPool(
+        1,
+        10,
         host=os.getenv("DATABASE_HOST", "localhost"),
         port=int(os.getenv("DATABASE_PORT", 5432)),
         database=os.getenv("DATABASE_NAME", "geopolitical_platform"),
         user=os.getenv("DATABASE_USER", "postgres"),
         password=os.getenv("DATABASE_PASSWORD", "postgres"),
-        cursor_factory=RealDictCursor,
     )
 
+@contextmanager
+def get_conn():
+    pool = get_pool()
+    conn = pool.getconn()
+    try:
+        yield conn
+    except Exception:
+        # Clear any failed transaction before the connection goes back
+        # into the pool
+        conn.rollback()
+        raise
+    finally:
+        pool.putconn(conn)
+
+def _connectorx_uri():
+    user = os.getenv("DATABASE_USER", "postgres")
+    pwd = os.getenv("DATABASE_PASSWORD", "postgres")
+    host = os.getenv("DATABASE_HOST", "localhost")
+    port = os.getenv("DATABASE_PORT", "5432")
+    db = os.getenv("DATABASE_NAME", "geopolitical_platform")
+    return f"postgresql://{user}:{pwd}@{host}:{port}/{db}"
+
+# Low-cardinality string columns worth dictionary-encoding: filters and
+# groupbys then run over integer codes instead of per-cell Python strings
+_CATEGORICAL_COLS = (
+    "threat_level", "threat_classification", "region", "country",
+    "hotspot_status", "trend_direction", "primary_base_country",
+)
+
+def _downcast_numeric(df: pd.DataFrame) -> pd.DataFrame:
+    # float32/int32 halve frame memory and roughly halve the JSON the
+    # figures serialize from these columns; display precision is
+    # unaffected at chart scale
+    for c, dtype in df.dtypes.items():
+        if dtype == np.float64:
+            df[c] = df[c].astype(np.float32)
+        elif dtype == np.int64 and (df[c].empty or df[c].abs().max() < 2**31):
+            df[c] = df[c].astype(np.int32)
+    return df
+
 @st.cache_data(ttl=600, show_spinner=False)
 def run_query(sql: str, params: tuple = None) -> pd.DataFrame:
-    conn = get_db_connection()
-    df = pd.read_sql_query(sql, conn, params=params)
+    # Second cache tier: zstd Parquet on disk keyed by the statement, so
+    # a restarted (or sibling) worker replays a file read instead of
+    # re-querying Postgres
+    digest = hashlib.sha1((sql + repr(params)).encode()).hexdigest()
+    cache_path = _DISK_CACHE_DIR / f"query_{digest}.parquet"
+    if cache_path.exists() and time.time() - cache_path.stat().st_mtime < _DISK_CACHE_TTL:
+        return pd.read_parquet(cache_path)
+
+    if cx is not None and params is None:
+        # ConnectorX path when installed (parameterless queries only —
+        # cx has no bind-parameter support). Arrow return type keeps the
+        # result columnar end to end with no per-row Python objects.
+        tbl = cx.read_sql(_connectorx_uri(), sql, return_type="arrow")
+        df = tbl.to_pandas(types_mapper=pd.ArrowDtype)
+    elif adbc is not None and params is None:
+        # ADBC fetches the same columnar Arrow batches over the Postgres
+        # wire protocol, just single-threaded
+        with adbc.connect(_connectorx_uri()) as aconn:
+            with aconn.cursor() as cur:
+                cur.execute(sql)
+                tbl = cur.fetch_arrow_table()
+        df = tbl.to_pandas(types_mapper=pd.ArrowDtype)
+    else:
+        # A named (server-side) cursor streams the result in chunks
+        # instead of buffering every row client-side before the
+        # DataFrame is built, which keeps peak memory flat on the
+        # larger mart queries.
+        with get_conn() as conn:
+            with conn.cursor(name="stream_" + uuid4().hex) as cur:
+                cur.itersize = 10_000
+                cur.execute(sql, params)
+                # Default tuple cursor: rows land as tuples and column
+                # names come from the cursor description once, instead
+                # of one string-keyed dict allocated per row
+                cols = None
+                chunks = []
+                for rows in iter(lambda: cur.fetchmany(10_000), []):
+                    if cols is None:
+                        cols = [d[0] for d in cur.description]
+                    chunks.append(pd.DataFrame(rows, columns=cols))
+            conn.commit()
+        df = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
+
+    for c in _CATEGORICAL_COLS:
+        if c in df.columns:
+            df[c] = df[c].astype("category")
+    _downcast_numeric(df)
+
+    _DISK_CACHE_DIR.mkdir(exist_ok=True)
+    # Write-then-rename so replicas sharing .cache/ never read a
+    # half-written file; the pid keeps concurrent writers apart
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    df.to_parquet(tmp_path, compression="zstd")
+    os.replace(tmp_path, cache_path)
     return df
 
 # --------------------------------------
 # Data loaders (dbt outputs expected)
 # --------------------------------------
-def load_hotspots():
-    q = """
-      SELECT * 
+# Explicit projections — the marts carry far more columns than any view
+# uses, and SELECT * pays for all of them in wire bytes, psycopg2
+# decoding, and DataFrame memory
+HOTSPOT_COLS = [
+    "country", "region", "latitude", "longitude",
+    "hotspot_status", "threat_level", "hotspot_intensity_score",
+    "incidents_recent", "casualties_recent", "num_active_groups",
+    "trend_direction", "incidents_yoy_pct_change",
+]
+GROUP_COLS = [
+    "primary_group", "expansion_rank", "expansion_velocity",
+    "countries_operated", "recent_expansion", "years_active",
+    "primary_base_country", "expansion_rate", "threat_classification",
+]
+SPILLOVER_COLS = [
+    "target_country", "num_source_countries", "total_spillover_attacks",
+    "total_shared_groups", "avg_time_to_spillover_years",
+    "total_spillover_risk_score", "top_source_countries",
+]
+FORECAST_COLS = [
+    "year", "country", "region", "incidents_lag1", "casualties_lag1",
+    "target_incidents_next_year", "incidents_momentum",
+    "incidents_volatility", "prior_year_spike", "active_groups",
+]
+CLUSTER_COLS = [
+    "primary_group", "total_attacks", "countries_operated",
+    "normalized_attack_volume", "normalized_lethality",
+    "normalized_geographic_reach", "suicide_attack_rate_pct",
+    "success_rate_pct", "explosives_pct", "firearms_pct",
+    "civilian_target_pct", "govt_target_pct",
+]
+PROFILE_COLS = [
+    "behavioral_archetype", "group_count", "total_attacks",
+    "suicide_attack_rate_pct", "success_rate_pct", "explosives_pct",
+    "firearms_pct", "civilian_target_pct", "govt_target_pct",
+    "countries_operated",
+]
+
+def load_hotspots(limit: int = None):
+    q = f"""
+      SELECT {', '.join(HOTSPOT_COLS)}
       FROM dbt_marts.emerging_hotspots
       ORDER BY hotspot_intensity_score DESC
     """
+    if limit:
+        q += f" LIMIT {int(limit)}"
     return run_query(q)
 
-def load_group_expansion():
+def load_exec_metrics():
+    # One round trip for the four summary cards; pulling the full marts
+    # just to count/sum them client-side moved thousands of rows for
+    # four scalars.
     q = """
-      SELECT *
+      SELECT
+          (SELECT count(*) FROM dbt_marts.emerging_hotspots
+            WHERE threat_level = 'Critical') AS critical_hotspots,
+          (SELECT count(*) FROM dbt_marts.group_expansion
+            WHERE threat_classification = 'Transnational Threat') AS high_threat_groups,
+          (SELECT sum(incidents_recent) FROM dbt_marts.emerging_hotspots) AS recent_incidents,
+          (SELECT count(DISTINCT country) FROM dbt_marts.emerging_hotspots) AS active_countries
+    """
+    return run_query(q).iloc[0]
+
+def load_group_expansion(limit: int = 100):
+    q = f"""
+      SELECT {', '.join(GROUP_COLS)}
       FROM dbt_marts.group_expansion
       ORDER BY expansion_velocity DESC
-      LIMIT 100
+      LIMIT {int(limit)}
     """
     return run_query(q)
 
 def load_cross_border():
-    q = """
-      SELECT *
+    q = f"""
+      SELECT {', '.join(SPILLOVER_COLS)}
       FROM dbt_marts.cross_border_risk
       ORDER BY total_spillover_risk_score DESC
       LIMIT 200
     """
     return run_query(q)
 
-def load_forecasting():
+def load_forecasting_latest():
+    # Only the newest year is plotted, so filter server-side instead of
+    # downloading every country-year and masking in pandas
+    q = f"""
+      SELECT {', '.join(FORECAST_COLS)}
+      FROM dbt_marts.forecasting_dataset
+      WHERE year = (SELECT max(year) FROM dbt_marts.forecasting_dataset)
+      ORDER BY country
+    """
+    # run_query downcasts to float32/int32 on the way in
+    return run_query(q)
+
+def load_risk_top15():
+    # Composite risk score and top-N selection evaluated in Postgres;
+    # 15 rows come back instead of the full mart
     q = """
-      SELECT *
+      SELECT
+          country, region,
+          (incidents_momentum * 0.4
+           + incidents_volatility * 0.3
+           + prior_year_spike * 0.3) AS risk_score,
+          incidents_momentum, incidents_volatility, active_groups,
+          target_incidents_next_year
       FROM dbt_marts.forecasting_dataset
-      ORDER BY year DESC, country
-      LIMIT 2000
+      WHERE year = (SELECT max(year) FROM dbt_marts.forecasting_dataset)
+      ORDER BY risk_score DESC
+      LIMIT 15
     """
     return run_query(q)
 
+def load_forecasting_yearly():
+    # Postgres collapses the mart to one row per year; shipping every
+    # country-year only to groupby('year') client-side was pure waste.
+    # The materialized view (created by scripts/setup_database.py) makes
+    # even the aggregation a precomputed read; fall back to aggregating
+    # the mart where it hasn't been created yet.
+    try:
+        return run_query("""
+          SELECT year, target_incidents_next_year, incidents_lag1, casualties_lag1
+          FROM dbt_marts.forecasting_yearly_agg
+          ORDER BY year
+        """)
+    except Exception:
+        return run_query("""
+          SELECT
+              year,
+              SUM(target_incidents_next_year) AS target_incidents_next_year,
+              SUM(incidents_lag1) AS incidents_lag1,
+              SUM(casualties_lag1) AS casualties_lag1
+          FROM dbt_marts.forecasting_dataset
+          GROUP BY year
+          ORDER BY year
+        """)
+
 def load_clustering():
-    q = """
-      SELECT *
+    q = f"""
+      SELECT {', '.join(CLUSTER_COLS)}
       FROM dbt_marts.group_clustering_features
       ORDER BY total_attacks DESC
       LIMIT 300
     """
     return run_query(q)
 
+def load_targeting_long():
+    # The melt to long form happens in SQL (UNION ALL over the top-20
+    # subquery), so the chart feeds px.bar directly instead of reshaping
+    # a frame with pandas on every rerun
+    q = """
+      WITH top_groups AS (
+          SELECT primary_group, civilian_target_pct, govt_target_pct
+          FROM dbt_marts.group_clustering_features
+          ORDER BY total_attacks DESC
+          LIMIT 20
+      )
+      SELECT primary_group, 'Civilian' AS target_type,
+             civilian_target_pct AS percentage
+      FROM top_groups
+      UNION ALL
+      SELECT primary_group, 'Government', govt_target_pct
+      FROM top_groups
+    """
+    return run_query(q)
+
 def load_network_edges():
     q = """
       SELECT DISTINCT
@@ -163,50 +440,202 @@ def load_network_edges():
 # --------------------------------------
 # Visualization helpers (light theme)
 # --------------------------------------
-PLOT_TEMPLATE = "simple_white"
+# One registered template instead of repeating template/margin kwargs on
+# every figure — each duplicated kwarg re-runs plotly's layout validator
+_gti_template = go.layout.Template(pio.templates["simple_white"])
+_gti_template.layout.margin = dict(l=16, r=16, t=56, b=16)
+pio.templates["gti_light"] = _gti_template
+pio.templates.default = "gti_light"
+
+THREAT_COLORS = {
+    "Critical": "#dc2626",
+    "High": "#f97316",
+    "Moderate": "#eab308",
+    "Low": "#16a34a",
+}
+
+# group_expansion.threat_classification levels (see
+# int_group_expansion_tracking.sql) — distinct from the hotspot
+# threat_level scale above
+CLASSIFICATION_COLORS = {
+    "Transnational Threat": "#dc2626",
+    "Regional Threat": "#f97316",
+    "Local Threat": "#16a34a",
+}
+
+# Content-based DataFrame hashing so cached figures are reused whenever
+# the underlying query result is unchanged
+_DF_HASH = {
+    pd.DataFrame: lambda df: pd.util.hash_pandas_object(df, index=True).values.tobytes()
+}
+
+def _arrow_table(df):
+    # st.dataframe serializes through Arrow regardless; handing it a
+    # pyarrow Table skips Streamlit's internal pandas conversion, and
+    # the conversion here is zero-copy for Arrow-backed columns
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+def _paginated_dataframe(df, key, page_size=25):
+    """Render a table one page at a time.
+
+    st.dataframe serializes the whole frame to the browser; paging keeps
+    the payload at page_size rows per interaction. The loaders already
+    ORDER BY the interesting metric, so page 1 is the page that matters.
+    """
+    n_pages = max(1, -(-len(df) // page_size))
+    page = 1
+    if n_pages > 1:
+        page = st.number_input(
+            f"Page (of {n_pages})", min_value=1, max_value=n_pages,
+            value=1, key=f"{key}_page",
+        )
+    start = (page - 1) * page_size
+    st.dataframe(_arrow_table(df.iloc[start:start + page_size]), use_container_width=True)
+
+@st.cache_resource(hash_funcs=_DF_HASH)
+def _explorer(df):
+    return StreamlitRenderer(df, kernel_computation=True)
+
+def _explorer_table(df, key, page_size=25):
+    """Free-form exploration table.
+
+    With PyGWalker installed, sort/filter/aggregate run in its DuckDB
+    kernel; otherwise fall back to the paginated st.dataframe.
+    """
+    if StreamlitRenderer is not None:
+        _explorer(df).explorer()
+    else:
+        _paginated_dataframe(df, key=key, page_size=page_size)
+
+def _downsample(df, max_points=1000):
+    """Uniform-stride thinning so no trace ships more than max_points.
+
+    The loaders cap rows today, but this keeps figure JSON payloads
+    bounded if those LIMITs are ever lifted.
+    """
+    if len(df) <= max_points:
+        return df
+    return df.iloc[:: len(df) // max_points + 1]
+
+def _scatter(df, x, y, size=None, color=None, color_map=None, text=None,
+             webgl_threshold=500):
+    """2D scatter figure that switches to WebGL above `webgl_threshold` points.
+
+    SVG Scatter degrades past a few hundred markers; Scattergl stays
+    smooth into the hundreds of thousands.
+    """
+    Trace = go.Scattergl if len(df) > webgl_threshold else go.Scatter
+    marker = dict(opacity=0.85)
+    if size is not None:
+        vals = df[size].to_numpy(dtype=np.float64)
+        marker.update(
+            size=vals,
+            sizemode="area",
+            sizeref=2.0 * np.nanmax(vals) / (18.0 ** 2) if len(vals) else 1.0,
+            sizemin=4,
+        )
+    if color is not None:
+        if color_map:
+            # Neutral gray for levels the map doesn't know, not NaN
+            colors = df[color].map(color_map).fillna("#6b7280")
+            marker.update(color=colors.to_numpy())
+        else:
+            marker.update(color=df[color].to_numpy(), colorscale="Blues", showscale=True)
+    fig = go.Figure(Trace(
+        x=df[x].to_numpy(),
+        y=df[y].to_numpy(),
+        mode="markers",
+        marker=marker,
+        text=df[text].to_numpy() if text else None,
+        hovertemplate="<b>%{text}</b><br>%{x} • %{y}<extra></extra>" if text else None,
+        showlegend=False,
+    ))
+    # closest avoids plotly's O(N) unified-hover scan
+    fig.update_layout(hovermode="closest")
+    return fig
 
 def fig_area(x, y, title):
-    fig = px.area(x=x, y=y, title=title, template=PLOT_TEMPLATE)
+    fig = px.area(x=x, y=y, title=title)
     fig.update_traces(line_color="#2563eb", fillcolor="rgba(37,99,235,0.15)")
-    fig.update_layout(height=380, margin=dict(l=16, r=16, t=56, b=16))
+    fig.update_layout(height=380)
     return fig
 
-def hotspot_geo_scatter(df):
-    fig = px.scatter_geo(
-        df,
-        lat="latitude",
-        lon="longitude",
-        color="threat_level",
-        size="hotspot_intensity_score",
-        hover_name="country",
-        projection="natural earth",
-        color_discrete_map={
-            "Critical": "#dc2626",
-            "High": "#f97316",
-            "Moderate": "#eab308",
-            "Low": "#16a34a",
+_THREAT_RGB = {
+    "Critical": (220, 38, 38),
+    "High": (249, 115, 22),
+    "Moderate": (234, 179, 8),
+    "Low": (22, 163, 74),
+}
+
+@st.cache_resource(hash_funcs=_DF_HASH)
+def _hotspot_deck(df):
+    """deck.gl scatter layer for the hotspot map.
+
+    Scattergeo draws SVG nodes, which caps the map at a few thousand
+    points; a ScatterplotLayer renders on the GPU, so the full frame
+    ships once and pans/zooms stay at 60 fps. Colors and radii are
+    precomputed as columns so deck.gl evaluates plain accessors instead
+    of per-point expressions.
+    """
+    pts = df[[
+        "country", "region", "latitude", "longitude", "threat_level",
+        "hotspot_intensity_score", "incidents_recent", "casualties_recent",
+    ]].copy()
+    score = pts["hotspot_intensity_score"].to_numpy(dtype=np.float64)
+    peak = np.nanmax(score) if len(score) else 1.0
+    pts["radius"] = 25_000 + 175_000 * (score / max(peak, 1e-9))
+    pts["fill"] = [
+        list(_THREAT_RGB.get(level, (107, 114, 128))) + [180]
+        for level in pts["threat_level"].astype(str)
+    ]
+    layer = pdk.Layer(
+        "ScatterplotLayer",
+        data=pts,
+        get_position=["longitude", "latitude"],
+        get_radius="radius",
+        get_fill_color="fill",
+        pickable=True,
+        stroked=True,
+        get_line_color=[255, 255, 255],
+        line_width_min_pixels=1,
+    )
+    return pdk.Deck(
+        layers=[layer],
+        initial_view_state=pdk.ViewState(latitude=20, longitude=0, zoom=1),
+        map_style="light",
+        tooltip={
+            "html": (
+                "<b>{country}</b><br/>Region: {region}"
+                "<br/>Intensity: {hotspot_intensity_score}"
+                "<br/>Incidents: {incidents_recent} &bull; "
+                "Casualties: {casualties_recent}"
+            )
         },
-        template=PLOT_TEMPLATE,
-        title="Global Terrorism Hotspot Intensity Map",
     )
-    fig.update_layout(height=480, margin=dict(l=0, r=0, t=56, b=0))
-    return fig
 
-def expansion_bar(df):
-    fig = px.bar(
-        df.sort_values("expansion_velocity"),
-        x="expansion_velocity",
-        y="primary_group",
+@st.cache_data(ttl=300, hash_funcs=_DF_HASH, show_spinner=False)
+def _expansion_bar_dict(df):
+    # Direct go.Bar — px's column-mapping/trace-splitting machinery is
+    # pure overhead for a single-trace bar of a few dozen rows
+    ordered = df.sort_values("expansion_velocity")
+    velocity = ordered["expansion_velocity"].to_numpy()
+    fig = go.Figure(go.Bar(
+        x=velocity,
+        y=ordered["primary_group"].to_numpy(),
         orientation="h",
-        color="expansion_velocity",
-        color_continuous_scale="Blues",
-        template=PLOT_TEMPLATE,
+        marker=dict(color=velocity, colorscale="Blues"),
+    ))
+    fig.update_layout(
         title="Fastest Expanding Organizations",
+        height=460,
     )
-    fig.update_layout(height=460, coloraxis_showscale=False, margin=dict(l=16, r=16, t=56, b=16))
-    return fig
+    return fig.to_dict()
 
-def spillover_choropleth(df):
+def expansion_bar(df):
+    return go.Figure(_expansion_bar_dict(df))
+
+@st.cache_data(ttl=300, hash_funcs=_DF_HASH, show_spinner=False)
+def _spillover_choropleth_dict(df):
     fig = px.choropleth(
         df,
         locations="target_country",
@@ -220,59 +649,213 @@ def spillover_choropleth(df):
             "target_country": False,
         },
         color_continuous_scale="Reds",
-        template=PLOT_TEMPLATE,
         title="Cross-Border Terrorism Spillover Risk Index",
     )
     fig.update_layout(height=520, margin=dict(l=0, r=0, t=56, b=0))
-    return fig
+    return fig.to_dict()
 
-def network_graph(edges_df):
-    # Build graph
-    G = nx.DiGraph()
-    for _, row in edges_df.iterrows():
-        G.add_edge(
-            row["source_country"],
-            row["target_country"],
-            weight=row["weight"],
-            groups=row["num_shared_groups"],
-            intensity=row["spillover_intensity_score"],
+def spillover_choropleth(df):
+    return go.Figure(_spillover_choropleth_dict(df))
+
+def _lbfgs_layout(G):
+    """Energy-minimization layout for larger graphs.
+
+    Minimizes a spring-electrical energy (quadratic attraction along
+    edges, 1/d repulsion between node pairs) with L-BFGS from a
+    Kamada-Kawai warm start. Converges in far fewer energy evaluations
+    than spring_layout's fixed-step simulation and lands in a better
+    local minimum. The repulsive term is evaluated as a dense pairwise
+    block — fine for the few hundred to low thousands of nodes this
+    page can produce, without the complexity of a Barnes-Hut tree.
+    """
+    from scipy.optimize import minimize
+
+    nodes = list(G.nodes())
+    n = len(nodes)
+    A = nx.to_scipy_sparse_array(G.to_undirected(), nodelist=nodes, weight=None).tocoo()
+    row, col = A.row, A.col
+    repulsion = 2.0 / n
+
+    warm = nx.kamada_kawai_layout(G)
+    x0 = np.asarray([warm[v] for v in nodes], dtype=np.float64).ravel()
+
+    def energy_grad(flat):
+        p = flat.reshape(n, 2)
+        d_edge = p[row] - p[col]
+        e_att = np.einsum("ij,ij->", d_edge, d_edge)
+        grad = np.zeros_like(p)
+        np.add.at(grad, row, 2.0 * d_edge)
+        np.add.at(grad, col, -2.0 * d_edge)
+
+        diff = p[:, None, :] - p[None, :, :]
+        dist2 = np.einsum("ijk,ijk->ij", diff, diff)
+        np.fill_diagonal(dist2, np.inf)
+        dist = np.sqrt(dist2)
+        e_rep = 0.5 * repulsion * np.sum(1.0 / dist)
+        grad -= repulsion * np.einsum("ij,ijk->ik", 1.0 / (dist2 * dist), diff)
+        return e_att + e_rep, grad.ravel()
+
+    res = minimize(
+        energy_grad, x0, jac=True, method="L-BFGS-B", options={"maxiter": 100}
+    )
+    pos_arr = nx.rescale_layout(res.x.reshape(n, 2))
+    return dict(zip(nodes, pos_arr))
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _fr_iterate(xy, eu, ev, w, iters, k):
+        # Fruchterman-Reingold over flat arrays: repulsion works in
+        # squared distance (no sqrt), the attractive pass updates both
+        # endpoints of each edge at once, and displacement is capped by
+        # a linearly annealed temperature
+        n = xy.shape[0]
+        disp = np.empty((n, 2))
+        t = 0.1
+        dt = t / (iters + 1)
+        for _ in range(iters):
+            for i in prange(n):
+                fx = 0.0
+                fy = 0.0
+                for j in range(n):
+                    if i == j:
+                        continue
+                    dx = xy[i, 0] - xy[j, 0]
+                    dy = xy[i, 1] - xy[j, 1]
+                    inv = 1.0 / max(dx * dx + dy * dy, 1e-6)
+                    fx += dx * inv * k * k
+                    fy += dy * inv * k * k
+                disp[i, 0] = fx
+                disp[i, 1] = fy
+            for e in range(eu.shape[0]):
+                i = eu[e]
+                j = ev[e]
+                dx = xy[i, 0] - xy[j, 0]
+                dy = xy[i, 1] - xy[j, 1]
+                d = (dx * dx + dy * dy) ** 0.5
+                if d < 1e-9:
+                    continue
+                f = w[e] * d / k
+                fx = dx * f
+                fy = dy * f
+                disp[i, 0] -= fx
+                disp[i, 1] -= fy
+                disp[j, 0] += fx
+                disp[j, 1] += fy
+            for i in range(n):
+                dl = (disp[i, 0] ** 2 + disp[i, 1] ** 2) ** 0.5
+                if dl > 1e-9:
+                    scale = min(dl, t) / dl
+                    xy[i, 0] += disp[i, 0] * scale
+                    xy[i, 1] += disp[i, 1] * scale
+            t -= dt
+        return xy
+
+def _numba_layout(G):
+    nodes = list(G.nodes())
+    index = {v: i for i, v in enumerate(nodes)}
+    m = G.number_of_edges()
+    eu = np.fromiter((index[u] for u, v in G.edges()), dtype=np.int64, count=m)
+    ev = np.fromiter((index[v] for u, v in G.edges()), dtype=np.int64, count=m)
+    w = np.fromiter(
+        (d.get("weight", 1.0) for _, _, d in G.edges(data=True)),
+        dtype=np.float64, count=m,
+    )
+    w /= max(w.max(), 1e-9)
+    xy = np.random.default_rng(42).standard_normal((len(nodes), 2)) * 0.1
+    k = (1.0 / max(len(nodes), 1)) ** 0.5
+    xy = _fr_iterate(xy, eu, ev, w, 60, k)
+    return {v: xy[i] for v, i in index.items()}
+
+def _graph_layout(G):
+    """Force-directed positions for G when igraph can't take the arrays
+    directly (see _network_graph_dict)."""
+    if len(G) > 200:
+        return _lbfgs_layout(G)
+    if njit is not None:
+        return _numba_layout(G)
+    return nx.spring_layout(G, k=1.6, iterations=60, seed=42)
+
+@st.cache_data(ttl=300, hash_funcs=_DF_HASH, show_spinner=False)
+def _network_graph_dict(edges_df):
+    if edges_df.empty:
+        return go.Figure().update_layout(title="No edges to display.").to_dict()
+
+    # The figure only needs index arrays, weights, degrees, and
+    # positions — all derivable from the edge list without a Python
+    # object graph. networkx is built lazily, only for the layout paths
+    # that still want it.
+    src_lbl = edges_df["source_country"].to_numpy()
+    tgt_lbl = edges_df["target_country"].to_numpy()
+    nodes = pd.unique(np.concatenate([src_lbl, tgt_lbl]))
+    node_index = {v: i for i, v in enumerate(nodes)}
+    n_edges = len(edges_df)
+    src = np.fromiter((node_index[v] for v in src_lbl), dtype=np.int64, count=n_edges)
+    dst = np.fromiter((node_index[v] for v in tgt_lbl), dtype=np.int64, count=n_edges)
+    weights = edges_df["weight"].to_numpy(dtype=np.float64)
+    deg = (
+        np.bincount(src, minlength=len(nodes))
+        + np.bincount(dst, minlength=len(nodes))
+    ).astype(np.int32)
+
+    if ig is not None and len(nodes) <= 200:
+        # igraph ingests the edge arrays at C level and lays out in C;
+        # no networkx structure is ever materialized
+        g = ig.Graph(n=len(nodes), edges=np.column_stack([src, dst]).tolist(),
+                     directed=True)
+        layout = g.layout_fruchterman_reingold(niter=60)
+        pos_arr = np.asarray(layout.coords, dtype=np.float32)
+    else:
+        G = nx.from_pandas_edgelist(
+            edges_df,
+            "source_country",
+            "target_country",
+            edge_attr=["weight"],
+            create_using=nx.DiGraph,
         )
+        pos = _graph_layout(G)
+        pos_arr = np.array([pos[v] for v in nodes], dtype=np.float32)
+
+    # One line trace for all edges: endpoint coordinates come from
+    # advanced indexing into the position array, with NaN separators
+    # between segments. One trace instead of one per edge keeps
+    # plotly.js from managing ~100 separate trace objects.
+    xs = np.stack(
+        [pos_arr[src, 0], pos_arr[dst, 0], np.full(n_edges, np.nan)], axis=1
+    )
+    ys = np.stack(
+        [pos_arr[src, 1], pos_arr[dst, 1], np.full(n_edges, np.nan)], axis=1
+    )
 
-    if len(G.nodes) == 0:
-        return go.Figure().update_layout(title="No edges to display.")
-
-    pos = nx.spring_layout(G, k=1.6, iterations=60, seed=42)
-
-    edge_traces = []
-    for u, v, data in G.edges(data=True):
-        x0, y0 = pos[u]
-        x1, y1 = pos[v]
-        width = max(1.0, float(np.log1p(data["weight"]) * 0.9))
-        edge_traces.append(
-            go.Scatter(
-                x=[x0, x1, None],
-                y=[y0, y1, None],
-                mode="lines",
-                line=dict(width=width, color="rgba(37,99,235,0.30)"),
-                hoverinfo="none",
-                showlegend=False,
-            )
+    # A single trace cannot carry per-segment line widths, so bin the
+    # log-scaled weights into four width buckets: four traces total
+    # instead of one per edge.
+    widths = np.maximum(1.0, np.log1p(weights) * 0.9)
+    bucket_widths = (1.0, 2.0, 3.0, 4.5)
+    buckets = np.digitize(widths, (1.5, 2.5, 3.5))
+    edge_traces = [
+        go.Scatter(
+            x=xs[buckets == bucket].ravel(),
+            y=ys[buckets == bucket].ravel(),
+            mode="lines",
+            line=dict(width=bucket_widths[bucket], color="rgba(37,99,235,0.30)"),
+            hoverinfo="none",
+            showlegend=False,
         )
+        for bucket in np.unique(buckets)
+    ]
+
+    # Node coordinates/sizes come straight from arrays already built for
+    # the edge traces — no per-node Python append loop
+    node_size = 8 + deg * 2
+    node_text = np.char.add(
+        np.char.add(np.asarray(nodes, dtype=str), " • deg="), deg.astype(str)
+    )
 
-    node_x, node_y, node_text, node_size = [], [], [], []
-    for n in G.nodes():
-        x, y = pos[n]
-        node_x.append(x)
-        node_y.append(y)
-        deg = G.degree(n)
-        node_size.append(8 + deg * 2)
-        node_text.append(f"{n} • deg={deg}")
-
-    node_trace = go.Scatter(
-        x=node_x, y=node_y, mode="markers+text",
-        text=[str(t)[:20] for t in G.nodes()],
-        textposition="top center",
-        textfont=dict(size=9),
+    # Markers only, WebGL-rendered: the in-plot text labels forced SVG
+    # and overlap badly past a few dozen nodes anyway — names stay on
+    # hover
+    node_trace = go.Scattergl(
+        x=pos_arr[:, 0], y=pos_arr[:, 1], mode="markers",
         hovertext=node_text,
         hovertemplate="%{hovertext}<extra></extra>",
         marker=dict(size=node_size, color="#2563eb", line=dict(width=1, color="#ffffff")),
@@ -283,14 +866,74 @@ def network_graph(edges_df):
     fig.update_layout(
         title="Cross-Border Terrorism Network",
         height=560,
-        margin=dict(l=16, r=16, t=56, b=16),
         xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
         yaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
-        template=PLOT_TEMPLATE,
     )
-    return fig
+    return fig.to_dict()
+
+def network_graph(edges_df):
+    return go.Figure(_network_graph_dict(edges_df))
+
+@st.cache_resource(show_spinner=False)
+def _fit_clusters(features_bytes: bytes, shape: tuple, n_clusters: int = 5):
+    """Standardize the feature matrix and fit the cluster model once.
+
+    Streamlit reruns the whole script on every widget interaction, so the
+    scaler + k-means fit is cached as a resource keyed on the raw feature
+    bytes; repeat visits to the tab become a dictionary lookup instead of
+    a refit. float32 halves memory and the BLAS distance work.
+
+    The fit is also persisted to disk keyed on the feature hash, so the
+    first load after a process restart reuses the model as long as the
+    clustering mart is unchanged.
+    """
+    digest = hashlib.sha1(features_bytes).hexdigest()[:16]
+    model_path = _DISK_CACHE_DIR / f"kmeans_{n_clusters}_{digest}.joblib"
+    if model_path.exists():
+        return joblib.load(model_path)
+    # .copy() makes the buffer writable so the scaler can standardize in
+    # place; everything stays float32 through the Cython Lloyd kernels
+    X = np.frombuffer(features_bytes, dtype=np.float32).reshape(shape).copy()
+
+    scaler = StandardScaler(copy=False)
+    Xs = scaler.fit_transform(X).astype(np.float32, copy=False)
+
+    # Mini-batch Lloyd iterations cost O(batch·k·d) instead of full-batch
+    # passes over every row per n_init restart — the fit dominated this
+    # page's render time with plain KMeans.
+    kmeans = MiniBatchKMeans(
+        n_clusters=n_clusters,
+        random_state=42,
+        n_init=3,
+        batch_size=256,
+        max_no_improvement=10,
+        tol=1e-3,
+    )
+    labels = kmeans.fit_predict(Xs)
+
+    _DISK_CACHE_DIR.mkdir(exist_ok=True)
+    joblib.dump((labels, scaler, kmeans), model_path, compress=3)
+    return labels, scaler, kmeans
+
+
+@st.cache_data(ttl=300, hash_funcs=_DF_HASH, show_spinner=False)
+def _cluster_df(df):
+    """Return a copy of the clustering mart with cluster labels attached."""
+    # Prefer labels batch-fitted by the behavioral_clusters Dagster
+    # asset; the in-process fit below is only the fallback for
+    # environments where that table hasn't been materialized yet
+    try:
+        pre = run_query(
+            "SELECT primary_group, cluster FROM data_analytics.behavioral_clusters"
+        )
+    except Exception:
+        pre = None
+    if pre is not None and not pre.empty:
+        merged = df.merge(pre, on="primary_group", how="left")
+        if merged["cluster"].notna().all():
+            merged["cluster"] = merged["cluster"].astype(int)
+            return merged
 
-def clustering_3d(df):
     # Features expected from your dbt_marts.group_clustering_features
     features = [
         "normalized_attack_volume",
@@ -303,35 +946,41 @@ def clustering_3d(df):
         "govt_target_pct",
         "civilian_target_pct",
     ]
-    X = df[features].fillna(0.0).astype(float)
-
-    scaler = StandardScaler()
-    Xs = scaler.fit_transform(X)
+    X = df[features].fillna(0.0).to_numpy(dtype=np.float32)
 
-    kmeans = KMeans(n_clusters=5, random_state=42, n_init=10)
+    labels, _, _ = _fit_clusters(X.tobytes(), X.shape)
     df = df.copy()
-    df["cluster"] = kmeans.fit_predict(Xs)
+    df["cluster"] = labels
+    return df
 
-    fig = go.Figure()
-    palette = ["#2563eb", "#f97316", "#dc2626", "#16a34a", "#eab308"]
 
-    for c in sorted(df["cluster"].unique()):
-        part = df[df["cluster"] == c]
-        fig.add_trace(go.Scatter3d(
-            x=part["normalized_attack_volume"],
-            y=part["normalized_lethality"],
-            z=part["normalized_geographic_reach"],
-            mode="markers",
-            name=f"Cluster {c}",
-            marker=dict(
-                size=np.clip(np.log1p(part["total_attacks"]), 4, 16),
-                color=palette[c % len(palette)],
-                opacity=0.85,
-                line=dict(width=0.5, color="#ffffff")
-            ),
-            text=part["primary_group"],
-            hovertemplate="<b>%{text}</b><br>Vol: %{x:.2f} • Leth: %{y:.2f} • Reach: %{z:.2f}<extra></extra>"
-        ))
+def clustering_3d(df):
+    df = _cluster_df(df)
+
+    # One trace for all clusters — each Scatter3d carries its own WebGL
+    # program, so a trace per cluster multiplies GPU state for no benefit.
+    # Cluster membership is encoded in per-point marker colors and hover.
+    palette = ["#2563eb", "#f97316", "#dc2626", "#16a34a", "#eab308"]
+    clusters = df["cluster"].to_numpy()
+    fig = go.Figure(go.Scatter3d(
+        x=df["normalized_attack_volume"],
+        y=df["normalized_lethality"],
+        z=df["normalized_geographic_reach"],
+        mode="markers",
+        marker=dict(
+            size=np.clip(np.log1p(df["total_attacks"]), 4, 16),
+            color=np.asarray(palette)[clusters % len(palette)],
+            opacity=0.85,
+            line=dict(width=0.5, color="#ffffff")
+        ),
+        text=df["primary_group"],
+        customdata=clusters,
+        hovertemplate=(
+            "<b>%{text}</b> (cluster %{customdata})"
+            "<br>Vol: %{x:.2f} • Leth: %{y:.2f} • Reach: %{z:.2f}<extra></extra>"
+        ),
+        showlegend=False,
+    ))
 
     fig.update_layout(
         title="Behavioral Clustering (3D): Volume × Lethality × Reach",
@@ -341,22 +990,18 @@ def clustering_3d(df):
             zaxis_title="Geographic Reach (norm.)",
         ),
         height=560,
-        template=PLOT_TEMPLATE,
-        margin=dict(l=16, r=16, t=56, b=16),
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
     )
     return fig, df
 
 # --------------------------------------
-# Data Fetch (fail fast if DB down)
+# Connectivity check (fail fast if DB down)
 # --------------------------------------
+# Each tab fetches its own data inside an st.fragment below, so the
+# first paint only pays for a connection probe plus the active tab.
 try:
-    hotspots_df = load_hotspots()
-    groups_df = load_group_expansion()
-    spillover_df = load_cross_border()
-    forecast_df = load_forecasting()
-    cluster_df = load_clustering()
-    network_df = load_network_edges()
+    with get_conn() as _conn:
+        with _conn.cursor() as _cur:
+            _cur.execute("SELECT 1")
 except Exception as e:
     st.error(f"Database connection failed: {e}")
     st.info("Verify environment variables and that PostgreSQL is reachable.")
@@ -384,23 +1029,35 @@ tab_exec, tab_hotspots, tab_groups, tab_cross, tab_predict, tab_cluster = st.tab
 # --------------------------------------
 # Executive Summary
 # --------------------------------------
-with tab_exec:
+@st.fragment(run_every=600)
+def render_exec():
     st.markdown("### Executive Summary")
+    # The four queries hit different tables and each pulls its own
+    # pooled connection, so fire them concurrently: cold-load latency
+    # becomes max() of the round trips instead of their sum
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        f_metrics = ex.submit(load_exec_metrics)
+        f_trend = ex.submit(load_forecasting_yearly)
+        f_hotspots = ex.submit(load_hotspots, 12)
+        f_groups = ex.submit(load_group_expansion, 15)
+        metrics = f_metrics.result()
+        trend = f_trend.result()
+        top_hotspots = f_hotspots.result()
+        top_groups = f_groups.result()
+
+    # Native st.metric instead of raw HTML cards: the React component is
+    # diffed by Streamlit and only repaints when the value changes,
+    # where the markdown string was re-parsed every rerun
     c1, c2, c3, c4 = st.columns(4)
-    with c1:
-        st.markdown('<div class="card metric"><div class="label">Critical Hotspots</div><div class="value">{}</div></div>'.format((hotspots_df["threat_level"]=="Critical").sum()), unsafe_allow_html=True)
-    with c2:
-        st.markdown('<div class="card metric"><div class="label">High-Threat Groups</div><div class="value">{}</div></div>'.format((groups_df["threat_classification"]=="Critical").sum()), unsafe_allow_html=True)
-    with c3:
-        st.markdown('<div class="card metric"><div class="label">Recent Incidents</div><div class="value">{:,.0f}</div></div>'.format(float(hotspots_df["incidents_recent"].sum())), unsafe_allow_html=True)
-    with c4:
-        st.markdown('<div class="card metric"><div class="label">Active Countries</div><div class="value">{}</div></div>'.format(hotspots_df["country"].nunique()), unsafe_allow_html=True)
+    c1.metric("Critical Hotspots", int(metrics["critical_hotspots"]))
+    c2.metric("High-Threat Groups", int(metrics["high_threat_groups"]))
+    c3.metric("Recent Incidents", f"{float(metrics['recent_incidents'] or 0):,.0f}")
+    c4.metric("Active Countries", int(metrics["active_countries"]))
 
     st.markdown('<div class="section"></div>', unsafe_allow_html=True)
 
-    # Incident Trends over time
-    trend = forecast_df.groupby("year", as_index=False).agg(incidents=("incidents_lag1", "sum"))
-    st.plotly_chart(fig_area(trend["year"], trend["incidents"], "Global Incident Trend Over Time"), use_container_width=True)
+    # Incident Trends over time (pre-aggregated in SQL)
+    st.plotly_chart(fig_area(trend["year"], trend["incidents_lag1"], "Global Incident Trend Over Time"), use_container_width=True)
 
     st.markdown('<div class="section"></div>', unsafe_allow_html=True)
 
@@ -408,31 +1065,31 @@ with tab_exec:
     c5, c6 = st.columns(2)
     with c5:
         st.markdown("#### Top Hotspots")
-        top_hotspots = hotspots_df.head(12)
-        fig = px.bar(
-            top_hotspots.sort_values("hotspot_intensity_score"),
-            x="hotspot_intensity_score",
-            y="country",
-            color="threat_level",
+        top_hotspots = top_hotspots.sort_values("hotspot_intensity_score")
+        fig = go.Figure(go.Bar(
+            x=top_hotspots["hotspot_intensity_score"].to_numpy(),
+            y=top_hotspots["country"].to_numpy(),
             orientation="h",
-            color_discrete_map={"Critical":"#dc2626","High":"#f97316","Moderate":"#eab308","Low":"#16a34a"},
-            template=PLOT_TEMPLATE
-        )
+            marker_color=top_hotspots["threat_level"].map(THREAT_COLORS).to_numpy(),
+        ))
         fig.update_layout(height=420, margin=dict(l=16,r=16,t=40,b=16))
         st.plotly_chart(fig, use_container_width=True)
 
     with c6:
         st.markdown("#### Fastest Expanding Groups")
-        st.plotly_chart(expansion_bar(groups_df.head(15)), use_container_width=True)
+        st.plotly_chart(expansion_bar(top_groups), use_container_width=True)
 
 # --------------------------------------
 # Hotspot Intelligence
 # --------------------------------------
-with tab_hotspots:
+@st.fragment
+def render_hotspots():
+    hotspots_df = load_hotspots()
     st.markdown("### Hotspot Intelligence")
     st.markdown("Identify where threat concentrations are emerging and intensifying.")
 
-    st.plotly_chart(hotspot_geo_scatter(hotspots_df), use_container_width=True)
+    st.markdown("#### Global Terrorism Hotspot Intensity Map")
+    st.pydeck_chart(_hotspot_deck(hotspots_df))
 
     st.markdown('<div class="section"></div>', unsafe_allow_html=True)
 
@@ -443,15 +1100,19 @@ with tab_hotspots:
         "num_active_groups", "trend_direction", "incidents_yoy_pct_change"
     ]].copy()
     if "incidents_yoy_pct_change" in df_display.columns:
-        df_display["incidents_yoy_pct_change"] = df_display["incidents_yoy_pct_change"].apply(
-            lambda x: f"{x:.1f}%" if pd.notnull(x) else "—"
+        # Whole-column string build instead of a Python lambda per row
+        col = df_display["incidents_yoy_pct_change"]
+        df_display["incidents_yoy_pct_change"] = np.where(
+            col.notna(), col.round(1).astype(str) + "%", "—"
         )
-    st.dataframe(df_display, use_container_width=True, height=420)
+    _explorer_table(df_display, key="hotspot_table")
 
 # --------------------------------------
 # Group Expansion
 # --------------------------------------
-with tab_groups:
+@st.fragment
+def render_groups():
+    groups_df = load_group_expansion()
     st.markdown("### Group Expansion")
     st.markdown("Which organizations are expanding operational reach the fastest?")
 
@@ -462,47 +1123,58 @@ with tab_groups:
     c1, c2 = st.columns(2)
     with c1:
         st.markdown("#### Expansion Velocity vs Total Reach")
-        fig = px.scatter(
+        fig = _scatter(
             groups_df.head(50),
             x="countries_operated",
             y="expansion_velocity",
             size="recent_expansion",
             color="threat_classification",
-            hover_name="primary_group",
-            labels={"countries_operated":"Total Countries","expansion_velocity":"Velocity (countries/yr)"},
-            color_discrete_map={"Critical":"#dc2626","High":"#f97316","Moderate":"#eab308"},
-            template=PLOT_TEMPLATE,
+            color_map=CLASSIFICATION_COLORS,
+            text="primary_group",
+        )
+        fig.update_layout(
+            xaxis_title="Total Countries",
+            yaxis_title="Velocity (countries/yr)",
+            height=440,
         )
-        fig.update_layout(height=440, margin=dict(l=16,r=16,t=56,b=16))
         st.plotly_chart(fig, use_container_width=True)
 
     with c2:
-        st.markdown("#### Recent Expansion Distribution (Top 20)")
+        st.markdown("#### Recent Expansion Distribution (Top 8 + Other)")
+        # Bound the slice count: 20 slices meant 20 SVG paths plus an
+        # unreadable long tail, so roll slices 9-20 into "Other"
+        top = groups_df.head(8)[["primary_group", "recent_expansion"]]
+        tail = groups_df.iloc[8:20]["recent_expansion"].sum()
+        pie_df = pd.concat(
+            [top, pd.DataFrame([{"primary_group": "Other", "recent_expansion": tail}])],
+            ignore_index=True,
+        )
         fig = px.pie(
-            groups_df.head(20),
+            pie_df,
             values="recent_expansion",
             names="primary_group",
             hole=0.45,
-            template=PLOT_TEMPLATE
         )
-        fig.update_layout(height=440, margin=dict(l=16,r=16,t=56,b=16))
+        fig.update_layout(height=440)
         st.plotly_chart(fig, use_container_width=True)
 
     st.markdown("#### Group Expansion Details")
-    st.dataframe(
+    _explorer_table(
         groups_df[[
             "primary_group","expansion_rank","expansion_velocity","countries_operated",
             "recent_expansion","years_active","primary_base_country","expansion_rate",
             "threat_classification"
-        ]].copy(),
-        use_container_width=True,
-        height=420
+        ]],
+        key="group_table",
     )
 
 # --------------------------------------
 # Cross-Border Networks
 # --------------------------------------
-with tab_cross:
+@st.fragment
+def render_cross():
+    network_df = load_network_edges()
+    spillover_df = load_cross_border()
     st.markdown("### Cross-Border Networks")
     st.markdown("Assess spillover risks and cross-border attack dynamics.")
 
@@ -519,66 +1191,56 @@ with tab_cross:
     c1, c2 = st.columns(2)
     with c1:
         st.markdown("#### Highest Risk Targets")
-        top_targets = spillover_df.head(12)
-        fig = px.bar(
-            top_targets.sort_values("total_spillover_risk_score"),
-            x="total_spillover_risk_score",
-            y="target_country",
-            color="total_spillover_risk_score",
-            color_continuous_scale="Reds",
-            template=PLOT_TEMPLATE,
-            orientation="h"
-        )
-        fig.update_layout(height=420, margin=dict(l=16,r=16,t=56,b=16), showlegend=False)
+        top_targets = spillover_df.head(12).sort_values("total_spillover_risk_score")
+        risk = top_targets["total_spillover_risk_score"].to_numpy()
+        fig = go.Figure(go.Bar(
+            x=risk,
+            y=top_targets["target_country"].to_numpy(),
+            orientation="h",
+            marker=dict(color=risk, colorscale="Reds"),
+        ))
+        fig.update_layout(height=420, showlegend=False)
         st.plotly_chart(fig, use_container_width=True)
 
     with c2:
         st.markdown("#### Source Diversity vs Attack Volume")
-        take = spillover_df.head(50)
-        fig = px.scatter(
-            take,
+        fig = _scatter(
+            spillover_df.head(50),
             x="num_source_countries",
             y="total_spillover_attacks",
             size="total_spillover_risk_score",
             color="total_shared_groups",
-            hover_name="target_country",
-            template=PLOT_TEMPLATE,
+            text="target_country",
+        )
+        fig.update_layout(
+            xaxis_title="num_source_countries",
+            yaxis_title="total_spillover_attacks",
+            height=420,
         )
-        fig.update_layout(height=420, margin=dict(l=16,r=16,t=56,b=16))
         st.plotly_chart(fig, use_container_width=True)
 
     st.markdown("#### Cross-Border Intelligence Table")
-    st.dataframe(
+    _explorer_table(
         spillover_df[[
             "target_country","num_source_countries","total_spillover_attacks",
             "total_shared_groups","avg_time_to_spillover_years",
             "total_spillover_risk_score","top_source_countries"
-        ]].copy(),
-        use_container_width=True,
-        height=420
+        ]],
+        key="spillover_table",
     )
 
 # --------------------------------------
 # Predictive Analytics
 # --------------------------------------
-with tab_predict:
-    st.markdown("### Predictive Analytics")
-    st.markdown("Momentum, volatility, and forward-looking incident indicators.")
-
-    # Time series summary
-    yearly = forecast_df.groupby("year", as_index=False).agg({
-        "target_incidents_next_year": "sum",
-        "incidents_lag1": "sum",
-        "casualties_lag1": "sum",
-    })
+@st.cache_resource
+def _trend_base_fig():
+    """Layout-complete trend figure with empty data arrays."""
     fig = go.Figure()
     fig.add_trace(go.Scatter(
-        x=yearly["year"], y=yearly["incidents_lag1"],
         mode="lines+markers", name="Historical Incidents",
         line=dict(color="#2563eb", width=3)
     ))
     fig.add_trace(go.Scatter(
-        x=yearly["year"], y=yearly["casualties_lag1"] / 10.0,
         mode="lines+markers", name="Casualties (÷10)",
         line=dict(color="#dc2626", width=2), yaxis="y2"
     ))
@@ -587,17 +1249,33 @@ with tab_predict:
         xaxis_title="Year",
         yaxis_title="Incidents",
         yaxis2=dict(title="Casualties (÷10)", overlaying="y", side="right"),
-        template=PLOT_TEMPLATE, height=420, hovermode="x unified",
-        margin=dict(l=16, r=16, t=56, b=16)
+        height=420, hovermode="x unified",
     )
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
+
+@st.fragment
+def render_predict():
+    st.markdown("### Predictive Analytics")
+    st.markdown("Momentum, volatility, and forward-looking incident indicators.")
+
+    # Time series summary (aggregated server-side). The base figure —
+    # traces, axes, the whole layout tree — is built once per process;
+    # reruns only swap in the current data arrays, so Streamlit diffs a
+    # couple of arrays instead of replaying a full Plotly.newPlot.
+    yearly = _downsample(load_forecasting_yearly())
+    fig = _trend_base_fig()
+    fig.data[0].x = yearly["year"].to_numpy()
+    fig.data[0].y = yearly["incidents_lag1"].to_numpy()
+    fig.data[1].x = yearly["year"].to_numpy()
+    fig.data[1].y = (yearly["casualties_lag1"] / 10.0).to_numpy()
+    st.plotly_chart(fig, use_container_width=True, key="trend")
 
     st.markdown('<div class="section"></div>', unsafe_allow_html=True)
 
-    # Latest-year risk scatter
-    latest_year = int(forecast_df["year"].max())
-    latest = forecast_df[forecast_df["year"] == latest_year].copy()
+    # Latest-year risk scatter (year filter pushed into the query)
+    latest = _downsample(load_forecasting_latest())
     if not latest.empty:
+        latest_year = int(latest["year"].iloc[0])
         st.markdown(f"#### Risk Momentum vs Volatility ({latest_year})")
         risk_fig = px.scatter(
             latest,
@@ -606,72 +1284,79 @@ with tab_predict:
             size="target_incidents_next_year",
             color="region",
             hover_name="country",
-            template=PLOT_TEMPLATE,
+            render_mode="webgl",
             title=None
         )
-        risk_fig.update_layout(height=460, margin=dict(l=16,r=16,t=16,b=16))
+        risk_fig.update_layout(height=460, hovermode="closest", margin=dict(l=16,r=16,t=16,b=16))
         st.plotly_chart(risk_fig, use_container_width=True)
 
-        # Simple composite risk score (weights can match your model)
-        if {"incidents_momentum","incidents_volatility","prior_year_spike"}.issubset(latest.columns):
-            latest["risk_score"] = (
-                latest["incidents_momentum"] * 0.4
-                + latest["incidents_volatility"] * 0.3
-                + latest["prior_year_spike"] * 0.3
-            )
-            st.markdown("#### Highest Predicted Risk (Top 15)")
-            top_risk = latest.nlargest(15, "risk_score")[[
-                "country","region","risk_score","incidents_momentum","incidents_volatility","active_groups","target_incidents_next_year"
-            ]].copy()
-            st.dataframe(top_risk.reset_index(drop=True).round(3), use_container_width=True, height=420)
+        # Composite risk score and top-15 selection computed in Postgres
+        st.markdown("#### Highest Predicted Risk (Top 15)")
+        st.dataframe(_arrow_table(load_risk_top15().round(3)), use_container_width=True, height=420)
 
 # --------------------------------------
 # Behavioral Clustering
 # --------------------------------------
-with tab_cluster:
+@st.fragment
+def render_cluster():
+    cluster_df = load_clustering()
     st.markdown("### Behavioral Clustering")
     st.markdown("Unsupervised grouping of organizations by tactics, lethality, and reach.")
 
-    fig3d, clustered = clustering_3d(cluster_df)
+    fig3d, _ = clustering_3d(cluster_df)
     st.plotly_chart(fig3d, use_container_width=True)
 
     st.markdown('<div class="section"></div>', unsafe_allow_html=True)
 
-    # Cluster profiles
-    cols_to_mean = [
-        "total_attacks",
-        "suicide_attack_rate_pct",
-        "success_rate_pct",
-        "explosives_pct",
-        "firearms_pct",
-        "civilian_target_pct",
-        "govt_target_pct",
-        "countries_operated",
-    ]
-    prof = clustered.groupby("cluster").agg({
-        "primary_group": "count",
-        **{c: "mean" for c in cols_to_mean}
-    }).rename(columns={"primary_group": "group_count"}).reset_index()
-    st.markdown("#### Cluster Profiles")
-    st.dataframe(prof.round(2), use_container_width=True, height=360)
-
-    # Targeting preferences bar (top 20 by total_attacks)
+    # Archetype profiles come pre-aggregated from the cluster_profiles
+    # mart (rebuilt nightly with dbt) — a handful of rows instead of a
+    # per-render pandas groupby over the full clustering mart
+    prof = run_query(f"""
+      SELECT {', '.join(PROFILE_COLS)}
+      FROM dbt_marts.cluster_profiles
+    """)
+    st.markdown("#### Archetype Profiles")
+    st.dataframe(_arrow_table(prof.round(2)), use_container_width=True, height=360)
+
+    # Targeting preferences bar (top 20 by total_attacks); the long-form
+    # frame arrives pre-melted from SQL
     st.markdown("#### Targeting Preferences (Top 20 groups)")
-    top20 = clustered.sort_values("total_attacks", ascending=False).head(20)
-    melted = top20[["primary_group","civilian_target_pct","govt_target_pct"]].melt(
-        id_vars="primary_group", var_name="Target Type", value_name="Percentage"
-    )
     fig_bar = px.bar(
-        melted,
-        x="Percentage",
+        load_targeting_long(),
+        x="percentage",
         y="primary_group",
-        color="Target Type",
+        color="target_type",
+        labels={"percentage": "Percentage", "target_type": "Target Type"},
         orientation="h",
-        template=PLOT_TEMPLATE
     )
-    fig_bar.update_layout(height=460, margin=dict(l=16,r=16,t=56,b=16))
+    fig_bar.update_layout(height=460)
     st.plotly_chart(fig_bar, use_container_width=True)
 
+def _render_when_visited(key, render, label):
+    # st.tabs runs every tab body on each full rerun, whether or not the
+    # tab is showing. The heavy tabs (graph layout, clustering) render a
+    # one-click gate on first sight; once visited, the session renders
+    # them directly on subsequent reruns.
+    visited = st.session_state.setdefault("visited", set())
+    if key in visited:
+        render()
+    elif st.button(label, key=f"load_{key}"):
+        visited.add(key)
+        render()
+
+with tab_exec:
+    render_exec()
+with tab_hotspots:
+    render_hotspots()
+with tab_groups:
+    render_groups()
+with tab_cross:
+    _render_when_visited("cross", render_cross, "Load network analysis")
+with tab_predict:
+    render_predict()
+with tab_cluster:
+    _render_when_visited("cluster", render_cluster, "Load clustering analysis")
+
 # --------------------------------------
 # Footer
 # --------------------------------------
@@ -0,0 +1,21 @@
+-- models/marts/cluster_profiles.sql
+-- Answer: "What does the average group in each behavioral archetype look like?"
+-- Precomputed here (marts rebuild with the nightly dbt run) so the dashboard
+-- reads a handful of rows instead of aggregating the clustering mart on
+-- every page render.
+
+select
+    behavioral_archetype,
+    count(*) as group_count,
+    avg(total_attacks) as total_attacks,
+    avg(suicide_attack_rate_pct) as suicide_attack_rate_pct,
+    avg(success_rate_pct) as success_rate_pct,
+    avg(explosives_pct) as explosives_pct,
+    avg(firearms_pct) as firearms_pct,
+    avg(civilian_target_pct) as civilian_target_pct,
+    avg(govt_target_pct) as govt_target_pct,
+    avg(countries_operated) as countries_operated
+
+from {{ ref('group_clustering_features') }}
+group by behavioral_archetype
+order by group_count desc
@@ -9,9 +9,12 @@ select
     avg(avg_expansion_lag_years) as avg_time_to_spillover_years,
     sum(spillover_intensity_score) as total_spillover_risk_score,
     
-    -- Top sources
-    (array_agg(source_country order by spillover_intensity_score desc))[1:3] 
-        as top_source_countries
+    -- Top sources, pre-joined to a display string so the dashboard
+    -- shows the column as-is instead of formatting an array per row
+    array_to_string(
+        (array_agg(source_country order by spillover_intensity_score desc))[1:3],
+        ', '
+    ) as top_source_countries
         
 from {{ ref('int_cross_border_flows') }}
 group by target_country
@@ -1,2 +1,39 @@
-select *
-from {{ source('data_raw', 'gtd_incidents')}}
\ No newline at end of file
+{#-
+    Ingestion loads the GTD sentinel codes (-9, -99, -999) untouched so the
+    source table preserves the workbook verbatim; the NULLIF chains below
+    turn them into proper NULLs once, server-side, for every downstream model.
+-#}
+
+{%- set sentinel_columns = [
+    'doubtterr', 'multiple', 'specificity', 'vicinity',
+    'nperps', 'nperpcap',
+    'nkill', 'nkillus', 'nkillter', 'nwound', 'nwoundus', 'nwoundte',
+    'property', 'propextent', 'ishostkid', 'nhostkid',
+] -%}
+
+{%- set all_columns = [
+    'eventid', 'iyear', 'imonth', 'iday', 'approxdate',
+    'country', 'country_txt', 'region', 'region_txt', 'provstate', 'city',
+    'latitude', 'longitude', 'specificity', 'vicinity', 'location',
+    'summary', 'doubtterr', 'multiple', 'success', 'suicide',
+    'attacktype1', 'attacktype1_txt',
+    'targtype1', 'targtype1_txt', 'targsubtype1', 'targsubtype1_txt',
+    'corp1', 'target1', 'natlty1', 'natlty1_txt',
+    'gname', 'gsubname', 'gname2', 'gname3', 'motive', 'nperps', 'nperpcap',
+    'weaptype1', 'weaptype1_txt', 'weapsubtype1', 'weapsubtype1_txt',
+    'weapdetail',
+    'nkill', 'nkillus', 'nkillter', 'nwound', 'nwoundus', 'nwoundte',
+    'property', 'propextent', 'ishostkid', 'nhostkid',
+] -%}
+
+select
+{% for col in all_columns %}
+    {{ ", " if not loop.first else "  " -}}
+    {%- if col in sentinel_columns -%}
+    nullif(nullif(nullif({{ col }}, -9), -99), -999) as {{ col }}
+    {%- else -%}
+    {{ col }}
+    {%- endif %}
+{%- endfor %}
+
+from {{ source('data_raw', 'gtd_incidents')}}
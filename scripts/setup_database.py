@@ -1,10 +1,28 @@
 """Initialize database schemas and tables."""
 import os
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Yearly rollup the dashboard reads instead of aggregating the full
+# forecasting mart per render; the unique index lets it be refreshed
+# with REFRESH MATERIALIZED VIEW CONCURRENTLY after each dbt run.
+# Depends on dbt_marts.forecasting_dataset, so on a fresh database
+# this only succeeds after the first `dbt run`.
+MATVIEW_DDL = """
+CREATE MATERIALIZED VIEW IF NOT EXISTS dbt_marts.forecasting_yearly_agg AS
+SELECT
+    year,
+    SUM(target_incidents_next_year) AS target_incidents_next_year,
+    SUM(incidents_lag1) AS incidents_lag1,
+    SUM(casualties_lag1) AS casualties_lag1
+FROM dbt_marts.forecasting_dataset
+GROUP BY year;
+CREATE UNIQUE INDEX IF NOT EXISTS forecasting_yearly_agg_year_idx
+ON dbt_marts.forecasting_yearly_agg (year);
+"""
+
 def setup_database():
     """Create necessary schemas in the database."""
     db_url = f"postgresql://{os.getenv('DATABASE_USER')}:{os.getenv('DATABASE_PASSWORD')}@{os.getenv('DATABASE_HOST')}:{os.getenv('DATABASE_PORT')}/{os.getenv('DATABASE_NAME')}"
@@ -14,11 +32,21 @@ def setup_database():
     # Schemas that match dbt_project.yml configuration
     schemas = ['data_raw', 'raw', 'staging', 'intermediate', 'marts', 'dbt']
 
-    with engine.connect() as conn:
-        for schema in schemas:
-            conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {schema}"))
-            print(f"✓ Created schema: {schema}")
-        conn.commit()
+    # One transaction and one round-trip for the whole idempotent DDL
+    # batch instead of an autobegin commit per statement
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            ";\n".join(f"CREATE SCHEMA IF NOT EXISTS {s}" for s in schemas)
+        )
+    for schema in schemas:
+        print(f"✓ Created schema: {schema}")
+
+    try:
+        with engine.begin() as conn:
+            conn.exec_driver_sql(MATVIEW_DDL)
+        print("✓ Created materialized view: dbt_marts.forecasting_yearly_agg")
+    except Exception:
+        print("⚠ Skipped dbt_marts.forecasting_yearly_agg (run again after 'dbt run')")
 
     print("\n✅ Database setup complete!")
     print("\n📋 Next steps:")
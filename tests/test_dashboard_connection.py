@@ -4,10 +4,31 @@ Test script to verify dashboard prerequisites
 Run this before launching the dashboard to ensure everything is configured correctly
 """
 
+import importlib.util
+import io
 import sys
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
+try:
+    import psycopg2
+except ImportError:
+    psycopg2 = None
+
+# Parse .env once at import; the checks read the resulting environment.
+# Re-calling load_dotenv() per check re-read and re-parsed the same file.
+load_dotenv()
+
+DB_DSN = {
+    'host': os.getenv('DATABASE_HOST', 'localhost'),
+    'port': os.getenv('DATABASE_PORT', 5432),
+    'database': os.getenv('DATABASE_NAME', 'geopolitical_platform'),
+    'user': os.getenv('DATABASE_USER', 'postgres'),
+    'password': os.getenv('DATABASE_PASSWORD', 'postgres'),
+}
+
 def test_python_version():
     """Check Python version"""
     print("🔍 Checking Python version...")
@@ -35,10 +56,18 @@ def test_dependencies():
 
     all_installed = True
     for module, name in required.items():
-        try:
-            __import__(module)
+        if module == 'psycopg2':
+            # Imported at module scope — present-but-broken C extensions
+            # surface there, which is the failure worth catching
+            found = psycopg2 is not None
+        else:
+            # find_spec only resolves the module on disk; importing
+            # pandas/sklearn/plotly executes their heavyweight __init__
+            # just to prove installation
+            found = importlib.util.find_spec(module) is not None
+        if found:
             print(f"   ✅ {name}")
-        except ImportError:
+        else:
             print(f"   ❌ {name} (missing)")
             all_installed = False
 
@@ -56,8 +85,6 @@ def test_env_file():
         print("   Create .env file with database credentials")
         return False
 
-    load_dotenv()
-
     required_vars = [
         'DATABASE_HOST',
         'DATABASE_PORT',
@@ -79,53 +106,39 @@ def test_env_file():
 
     return all_set
 
-def test_database_connection():
-    """Test connection to PostgreSQL database"""
+def check_database_connection():
+    """Test connection to PostgreSQL database.
+
+    Returns the open connection on success (None on failure) so later
+    checks reuse it instead of paying a second TCP/auth handshake.
+    """
     print("\n🔍 Testing database connection...")
 
-    try:
-        import psycopg2
-        load_dotenv()
+    if psycopg2 is None:
+        print("   ❌ psycopg2 is not installed")
+        return None
 
-        conn = psycopg2.connect(
-            host=os.getenv('DATABASE_HOST', 'localhost'),
-            port=os.getenv('DATABASE_PORT', 5432),
-            database=os.getenv('DATABASE_NAME', 'geopolitical_platform'),
-            user=os.getenv('DATABASE_USER', 'postgres'),
-            password=os.getenv('DATABASE_PASSWORD', 'postgres')
-        )
+    try:
+        conn = psycopg2.connect(**DB_DSN)
 
-        cursor = conn.cursor()
-        cursor.execute("SELECT version();")
-        version = cursor.fetchone()[0]
+        # server_version comes back in the startup exchange — no need to
+        # spend a round-trip on SELECT version() just for the banner
+        sv = conn.server_version
         print(f"   ✅ Connected to PostgreSQL")
-        print(f"   ℹ️  {version[:50]}...")
+        print(f"   ℹ️  PostgreSQL {sv // 10000}.{sv % 100}")
 
-        cursor.close()
-        conn.close()
-        return True
+        return conn
 
     except Exception as e:
         print(f"   ❌ Database connection failed: {str(e)}")
         print("   Ensure PostgreSQL is running and credentials are correct")
-        return False
+        return None
 
-def test_mart_tables():
-    """Check if required mart tables exist"""
+def check_mart_tables(conn):
+    """Check if required mart tables exist (on the shared connection)"""
     print("\n🔍 Checking dbt mart tables...")
 
     try:
-        import psycopg2
-        load_dotenv()
-
-        conn = psycopg2.connect(
-            host=os.getenv('DATABASE_HOST', 'localhost'),
-            port=os.getenv('DATABASE_PORT', 5432),
-            database=os.getenv('DATABASE_NAME', 'geopolitical_platform'),
-            user=os.getenv('DATABASE_USER', 'postgres'),
-            password=os.getenv('DATABASE_PASSWORD', 'postgres')
-        )
-
         cursor = conn.cursor()
 
         required_tables = [
@@ -136,29 +149,40 @@ def test_mart_tables():
             'dbt_marts.group_clustering_features'
         ]
 
+        # One catalog query for all five tables instead of an EXISTS plus
+        # a COUNT(*) per table (10 round-trips); reltuples is the
+        # planner's estimate, O(1) versus a sequential scan per count
+        cursor.execute("""
+            SELECT n.nspname || '.' || c.relname, c.reltuples::bigint
+            FROM pg_class c
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE (n.nspname, c.relname) IN %s
+              AND c.relkind IN ('r', 'm', 'v')
+        """, (tuple(tuple(t.split('.')) for t in required_tables),))
+        found = dict(cursor.fetchall())
+
+        # Tables with no planner estimate yet (reltuples = -1, fresh
+        # load) get exact counts — all in one UNION ALL round-trip
+        unanalyzed = [t for t in required_tables if found.get(t, 0) < 0]
+        if unanalyzed:
+            cursor.execute(" UNION ALL ".join(
+                f"SELECT '{t}', COUNT(*) FROM {t}" for t in unanalyzed
+            ))
+            found.update(cursor.fetchall())
+
         all_exist = True
         for table in required_tables:
-            schema, table_name = table.split('.')
-            cursor.execute("""
-                SELECT EXISTS (
-                    SELECT FROM information_schema.tables
-                    WHERE table_schema = %s
-                    AND table_name = %s
-                );
-            """, (schema, table_name))
-
-            exists = cursor.fetchone()[0]
-            if exists:
-                # Get row count
-                cursor.execute(f"SELECT COUNT(*) FROM {table};")
-                count = cursor.fetchone()[0]
-                print(f"   ✅ {table} ({count:,} rows)")
+            if table in found:
+                count = found[table]
+                if table in unanalyzed:
+                    print(f"   ✅ {table} ({count:,} rows)")
+                else:
+                    print(f"   ✅ {table} (~{count:,} rows est.)")
             else:
                 print(f"   ❌ {table} (not found)")
                 all_exist = False
 
         cursor.close()
-        conn.close()
 
         if not all_exist:
             print("\n   Run: cd dbt_project && dbt run --select marts")
@@ -173,28 +197,93 @@ def test_dashboard_file():
     """Check if dashboard.py exists"""
     print("\n🔍 Checking dashboard file...")
 
-    if os.path.exists('dashboard.py'):
-        size = os.path.getsize('dashboard.py')
-        print(f"   ✅ dashboard.py ({size:,} bytes)")
-        return True
-    else:
+    try:
+        # One stat(2) for existence and size both
+        st = os.stat('dashboard.py')
+    except FileNotFoundError:
         print("   ❌ dashboard.py not found")
         return False
+    print(f"   ✅ dashboard.py ({st.st_size:,} bytes)")
+    return True
+
+class _ThreadLocalStdout:
+    """Routes print() to a per-thread buffer so concurrent checks don't
+    interleave their output."""
+
+    def __init__(self, fallback):
+        self._fallback = fallback
+        self._local = threading.local()
+
+    def register(self, buf):
+        self._local.buf = buf
+
+    def write(self, text):
+        target = getattr(self._local, 'buf', None)
+        (target if target is not None else self._fallback).write(text)
+
+    def flush(self):
+        target = getattr(self._local, 'buf', None)
+        (target if target is not None else self._fallback).flush()
+
+def _buffered(proxy, fn):
+    buf = io.StringIO()
+    proxy.register(buf)
+    try:
+        return fn(), buf
+    finally:
+        proxy.register(None)
+
+def _database_checks():
+    """Connection + mart checks share one connection, so they run as a
+    unit on a single worker."""
+    conn = check_database_connection()
+    try:
+        marts = check_mart_tables(conn) if conn else False
+    finally:
+        if conn is not None:
+            conn.close()
+    return {'Database Connection': conn is not None, 'Mart Tables': marts}
 
 def main():
-    """Run all tests"""
+    """Run all checks (CLI entry; the check_* DB steps take arguments,
+    so they are named out of pytest collection)."""
     print("=" * 70)
     print("🔒 DASHBOARD PREREQUISITES TEST 🔒")
     print("=" * 70)
 
-    results = {
-        'Python Version': test_python_version(),
-        'Dependencies': test_dependencies(),
-        'Environment Config': test_env_file(),
-        'Database Connection': test_database_connection(),
-        'Mart Tables': test_mart_tables(),
-        'Dashboard File': test_dashboard_file()
-    }
+    # The checks are independent (the two DB steps run as one unit) and
+    # I/O-bound — sockets for Postgres, stat calls for find_spec — so
+    # run them concurrently and replay each buffer in display order
+    proxy = _ThreadLocalStdout(sys.stdout)
+    checks = [
+        ('Python Version', test_python_version),
+        ('Dependencies', test_dependencies),
+        ('Environment Config', test_env_file),
+        ('Database', _database_checks),
+        ('Dashboard File', test_dashboard_file),
+    ]
+    original_stdout = sys.stdout
+    sys.stdout = proxy
+    try:
+        with ThreadPoolExecutor(max_workers=len(checks)) as ex:
+            futures = [
+                (name, ex.submit(_buffered, proxy, fn)) for name, fn in checks
+            ]
+            outcomes = [(name, f.result()) for name, f in futures]
+    finally:
+        sys.stdout = original_stdout
+
+    # Each check's output is already buffered; join and emit the whole
+    # report in one write instead of a print per check
+    results = {}
+    report = []
+    for name, (result, buf) in outcomes:
+        report.append(buf.getvalue())
+        if name == 'Database':
+            results.update(result)
+        else:
+            results[name] = result
+    sys.stdout.write("".join(report))
 
     print("\n" + "=" * 70)
     print("📊 TEST SUMMARY")